@@ -1,7 +1,8 @@
+import configparser
+import os
 import sys
 from logging.config import fileConfig
 
-from sqlalchemy import create_engine
 from alembic import context
 
 # --- Alembic/Projekt-Integration START ---
@@ -10,9 +11,12 @@ from alembic import context
 # damit wir die 'core'-Module importieren können. # noqa: E402
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from core.db_models import Base  # noqa: E402
+# Anhängen statt vorne einfügen: Die Standardbibliothek und installierte Pakete werden
+# weiterhin zuerst gefunden. Die Prüfung verhindert zudem, dass der Pfad bei jeder
+# Alembic-Ausführung im selben Prozess erneut hinzugefügt wird.
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
 
 # --- Alembic/Projekt-Integration END ---
 
@@ -25,10 +29,30 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+
+def _get_target_metadata():
+    """
+    Lädt die ORM-Modelle erst bei Bedarf.
+
+    Der Import von core.db_models zieht das komplette SQLAlchemy-ORM nach sich und
+    wird daher erst ausgeführt, wenn eine Migration tatsächlich läuft.
+    """
+    from core.db_models import Base
+
+    return Base.metadata
+
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # Hier weisen wir Alembic an, unsere Modelle für den autogenerate-Prozess zu verwenden.
-target_metadata = Base.metadata
+# PEP 562: 'target_metadata' wird beim ersten Zugriff geladen und zwischengespeichert.
+def __getattr__(name):
+    if name == "target_metadata":
+        metadata = _get_target_metadata()
+        globals()[name] = metadata
+        return metadata
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -36,6 +60,49 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def _parse_db_url(path: str):
+    """Liest den [postgresql]-Abschnitt einer config.ini und baut daraus die DB-URL."""
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    if not parser.has_section("postgresql"):
+        return None
+    db_config = parser["postgresql"]
+    if not all(db_config.get(key) for key in ("host", "database", "user", "password")):
+        return None
+    from sqlalchemy import URL
+
+    # URL.create maskiert Sonderzeichen in Benutzername/Passwort korrekt,
+    # analog zum DatabaseManager.
+    url = URL.create(
+        drivername="postgresql+psycopg",
+        username=db_config["user"],
+        password=db_config["password"],
+        host=db_config["host"],
+        database=db_config["database"],
+    )
+    return url.render_as_string(hide_password=False)
+
+
+def get_project_db_url():
+    """
+    Ermittelt die DB-URL aus der config.ini des Projekts (CWD, AppData, Root).
+
+    Wird verwendet, wenn Alembic direkt über die Kommandozeile aufgerufen wird und
+    der DatabaseManager die 'sqlalchemy.url' nicht bereits gesetzt hat.
+    """
+    from core.settings_manager import get_app_data_dir, get_application_root_dir
+
+    candidates = (
+        Path.cwd() / "config.ini",
+        get_app_data_dir() / "config.ini",
+        get_application_root_dir() / "config.ini",
+    )
+    for path in candidates:
+        if path.is_file():
+            return _parse_db_url(str(path))
+    return None
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -48,14 +115,12 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    db_config = config.get_section("postgresql")
-    url = (
-        f"postgresql+psycopg://{db_config['user']}:{db_config['password']}"
-        f"@{db_config['host']}/{db_config['database']}"
-    )
+    url = config.get_main_option("sqlalchemy.url") or get_project_db_url()
+    if url is None:
+        raise ValueError("Es konnte keine Datenbank-URL ermittelt werden (config.ini prüfen).")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=_get_target_metadata(),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -64,6 +129,30 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _pool_options_from_env() -> dict:
+    """
+    Liest optionale Pool-Einstellungen für Alembic-CLI-Läufe aus der Umgebung.
+
+    Ohne gesetzte Variablen gelten die Standardwerte von SQLAlchemy.
+    """
+    options = {}
+    if os.getenv("ALEMBIC_POOL_SIZE"):
+        options["pool_size"] = int(os.getenv("ALEMBIC_POOL_SIZE"))
+    if os.getenv("ALEMBIC_POOL_TIMEOUT"):
+        options["pool_timeout"] = float(os.getenv("ALEMBIC_POOL_TIMEOUT"))
+    if os.getenv("ALEMBIC_POOL_PRE_PING"):
+        options["pool_pre_ping"] = os.getenv("ALEMBIC_POOL_PRE_PING").lower() in ("1", "true", "yes")
+    return options
+
+
+def _run_migrations_with_connection(connection) -> None:
+    """Führt die Migrationen auf einer bestehenden Verbindung aus."""
+    context.configure(connection=connection, target_metadata=_get_target_metadata())
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
@@ -71,18 +160,30 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Hat der Aufrufer (z.B. der DatabaseManager) bereits eine Verbindung aus seiner
+    # Engine übergeben, wird diese wiederverwendet. So entfällt der komplette
+    # Verbindungsaufbau (TCP + Authentifizierung) für die Migration.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_migrations_with_connection(connection)
+        return
+
     # Nutze die 'sqlalchemy.url', die vom DatabaseManager gesetzt wird.
     # Dies ist der robusteste Weg, um die Konfiguration zu übergeben.
-    db_url = config.get_main_option("sqlalchemy.url")
+    # Bei direktem CLI-Aufruf fällt env.py auf die config.ini des Projekts zurück.
+    db_url = config.get_main_option("sqlalchemy.url") or get_project_db_url()
     if db_url is None:
         raise ValueError("Die Datenbank-URL wurde nicht in der Alembic-Konfiguration gesetzt.")
-    connectable = create_engine(db_url)
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+    from sqlalchemy import create_engine
+
+    connectable = create_engine(db_url, **_pool_options_from_env())
 
-        with context.begin_transaction():
-            context.run_migrations()
+    try:
+        with connectable.connect() as connection:
+            _run_migrations_with_connection(connection)
+    finally:
+        connectable.dispose()
 
 
 if context.is_offline_mode():
@@ -14,14 +14,26 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import argparse
+import concurrent.futures
+import errno
+import functools
+import hashlib
+import io
+import json
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import threading
 import pathlib
 import re
+import shlex
+import stat
+import zipfile
 import importlib.metadata
+import importlib.util
 from core._version import __version__
 
 # --- Konfiguration ---
@@ -33,8 +45,53 @@ DIST_DIR = pathlib.Path("dist")
 ASSETS_DIR = pathlib.Path("assets")
 BUILD_DIR = pathlib.Path("build")
 SPEC_FILE = pathlib.Path(f"{APP_NAME}.spec")
+BUILD_LOG = pathlib.Path("build.log")
 
 FILES_TO_COPY_TO_RELEASE = ["README.md", "config.ini.example"]
+# Daten, die direkt in die ausführbare Datei gebündelt werden sollen (Quelle, Ziel im Bundle).
+DATA_TO_ADD = [
+    (ASSETS_DIR, ASSETS_DIR),
+    (pathlib.Path("game_config.json"), pathlib.Path(".")),
+    (pathlib.Path("core/checkout_paths.json"), pathlib.Path("core")),
+    (pathlib.Path("alembic.ini"), pathlib.Path(".")),
+    (pathlib.Path("alembic"), pathlib.Path("alembic")),
+    (pathlib.Path("config.ini.example"), pathlib.Path(".")),
+]
+
+# Bereits komprimierte Dateien werden unverändert gespeichert (ZIP_STORED),
+# ein erneutes Deflate kostet nur CPU-Zeit und bringt praktisch keine Ersparnis.
+# Das gilt auch für alle großen Dateien: Das ist praktisch nur die PyInstaller-Onefile
+# (unter Linux ohne Endung), die ihren Inhalt bereits selbst komprimiert.
+PRECOMPRESSED_SUFFIXES = {".exe", ".app", ".bin", ".zip"}
+STORE_SIZE_THRESHOLD = 1024 * 1024  # 1 MB
+
+# Merkt sich den Quellcode-Stand des letzten erfolgreichen Testlaufs.
+BUILD_CACHE_DIR = pathlib.Path(".build_cache")
+TESTS_OK_MARKER = BUILD_CACHE_DIR / "tests_ok.json"
+# Nur Änderungen an diesen Dateien machen einen erneuten Testlauf nötig.
+TEST_RELEVANT_SUFFIXES = {".py", ".json", ".ini", ".cfg", ".toml"}
+TEST_IRRELEVANT_DIRS = {"assets", ".venv", "venv", BUILD_DIR.name, DIST_DIR.name}
+
+
+def _collect_present_paths(paths) -> set[pathlib.Path]:
+    """
+    Ermittelt, welche der übergebenen Pfade existieren.
+
+    Liest jedes Elternverzeichnis einmal per os.scandir, statt jeden Pfad
+    einzeln per stat abzufragen.
+    """
+    names_by_parent = {}
+    for path in paths:
+        names_by_parent.setdefault(path.parent, set()).add(path.name)
+
+    present = set()
+    for parent, names in names_by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                present.update(parent / entry.name for entry in entries if entry.name in names)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return present
 
 
 def check_installed_requirements():
@@ -75,27 +132,121 @@ def check_installed_requirements():
         return True
 
 
-def run_tests():
-    """Führt die Test-Suite aus und bricht bei Fehlern ab."""
-    print("\n>>> Schritt 0.5: Führe Test-Suite aus...")
+def _is_test_relevant(path: pathlib.Path) -> bool:
+    """Gibt zurück, ob eine Änderung an dieser Datei das Testergebnis beeinflussen kann."""
+    if path.parts and path.parts[0] in TEST_IRRELEVANT_DIRS:
+        return False
+    return path.suffix in TEST_RELEVANT_SUFFIXES or path.name.startswith("requirements")
+
+
+def _hash_file(digest, path: pathlib.Path):
+    """Füttert den Hash blockweise (1 MiB) mit dem Dateiinhalt."""
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+
+def compute_source_hash():
+    """
+    Berechnet einen SHA-256-Hash über alle testrelevanten Dateien des Projekts.
+
+    Neben den versionierten Dateien werden auch neue, noch nicht eingecheckte
+    Dateien berücksichtigt (sofern nicht per .gitignore ausgeschlossen), da
+    z.B. ein neues Testmodul das Testergebnis verändert.
+
+    Reine Asset- oder Doku-Änderungen (z.B. README.md, assets/) verändern den Hash nicht.
+    Ohne Git wird auf Pfad, Größe und Änderungszeit aller .py-Dateien zurückgegriffen.
+    """
+    digest = hashlib.sha256()
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            capture_output=True,
+            check=True,
+        )
+        for name in sorted(filter(None, result.stdout.split(b"\0"))):
+            path = pathlib.Path(os.fsdecode(name))
+            if not _is_test_relevant(path):
+                continue
+            digest.update(name)
+            if path.is_file():
+                _hash_file(digest, path)
+    except (OSError, subprocess.CalledProcessError):
+        for path in sorted(pathlib.Path(".").rglob("*.py")):
+            if not _is_test_relevant(path):
+                continue
+            st = path.stat()
+            digest.update(f"{path}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _tests_already_passed(source_hash):
+    """Prüft, ob die Tests für genau diesen Quellcode-Stand schon bestanden wurden."""
+    try:
+        marker = json.loads(TESTS_OK_MARKER.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return marker.get("hash") == source_hash and marker.get("py") == sys.version
+
+
+def _mark_tests_passed(source_hash):
+    """Speichert den Quellcode-Stand des erfolgreichen Testlaufs."""
     try:
-        # Vorab-Check ob pytest installiert ist
-        import pytest
-    except ImportError:
-        print("  -> Warnung: 'pytest' nicht gefunden. Überspringe Tests.")
+        BUILD_CACHE_DIR.mkdir(exist_ok=True)
+        TESTS_OK_MARKER.write_text(
+            json.dumps({"hash": source_hash, "py": sys.version}), encoding="utf-8"
+        )
+    except OSError as e:
+        print(f"  -> Warnung: Test-Cache konnte nicht geschrieben werden: {e}")
+
+
+def run_tests(force=False, output=None, on_start=None):
+    """
+    Führt die Test-Suite aus und bricht bei Fehlern ab.
+
+    Args:
+        force (bool): Tests auch dann ausführen, wenn sich seit dem letzten
+                      erfolgreichen Lauf nichts Relevantes geändert hat.
+        output (io.TextIOBase | None): Ziel für alle Ausgaben inkl. pytest. Läuft die
+                      Test-Suite parallel zum Build, wird sie so gesammelt statt mit
+                      der PyInstaller-Ausgabe vermischt. None schreibt direkt auf stdout.
+        on_start (callable | None): Erhält den gestarteten pytest-Prozess, damit der
+                      Aufrufer ihn bei einem Abbruch beenden kann.
+    """
+    log = functools.partial(print, file=output)
+    log("\n>>> Schritt 0.5: Führe Test-Suite aus...")
+    # Vorab-Check ob pytest installiert ist (find_spec lädt das Modul nicht)
+    if importlib.util.find_spec("pytest") is None:
+        log("  -> Warnung: 'pytest' nicht gefunden. Überspringe Tests.")
+        return True
+
+    # Unveränderter Quellcode seit dem letzten grünen Lauf -> Tests überspringen.
+    source_hash = compute_source_hash()
+    if not force and _tests_already_passed(source_hash):
+        log(">>> ✅ Quellcode unverändert seit dem letzten erfolgreichen Testlauf. Überspringe.")
         return True
 
     try:
         # Die Konfiguration für Coverage etc. wird jetzt aus der pytest.ini gelesen.
         # Wir behalten nur die Flags, die wir speziell für den Build-Prozess wollen.
+
+        # Mit pytest-xdist laufen die Tests parallel auf allen CPU-Kernen.
+        # Mit CI_SERIAL=1 wird seriell getestet, z.B. zum Debuggen instabiler Tests.
+        parallel = not os.getenv("CI_SERIAL") and importlib.util.find_spec("xdist") is not None
+
         test_command = [
             sys.executable,
             "-m",
             "pytest",
-            "-sv",  # -s: print() ausgeben, -v: verbose. Gut für Build-Logs.
+            # -s: print() ausgeben, -v: verbose. Gut für Build-Logs.
+            # xdist fängt die Ausgabe pro Worker ab, dort ist -s wirkungslos.
+            "-v" if parallel else "-sv",
             "-m",  # Marker-Argument für pytest
             "not db",  # Der eigentliche Marker-Ausdruck
         ]
+        if parallel:
+            # --dist=loadfile hält die Tests einer Datei auf einem Worker (gemeinsame Fixtures).
+            test_command += ["-n", "auto", "--dist=loadfile"]
 
         # Auf Linux-Systemen (wie in der CI) müssen GUI-Tests in einer virtuellen Anzeige laufen.
         # Wir prüfen, ob wir in einer CI-Umgebung sind, um xvfb-run nur dort zu verwenden.
@@ -103,90 +254,215 @@ def run_tests():
             if shutil.which("xvfb-run"):
                 test_command.insert(0, "xvfb-run")
             else:
-                print("  -> Hinweis: CI erkannt, aber 'xvfb-run' nicht gefunden. Führe Tests ohne Xvfb aus...")
+                log("  -> Hinweis: CI erkannt, aber 'xvfb-run' nicht gefunden. Führe Tests ohne Xvfb aus...")
 
         # Führe den Befehl aus. Wir verwenden nicht check=True, um die Ausnahme selbst zu behandeln
         # und eine bessere Fehlermeldung auszugeben.
-        result = subprocess.run(test_command)
+        capture = subprocess.PIPE if output is not None else None
+        process = subprocess.Popen(
+            test_command,
+            stdout=capture,
+            stderr=subprocess.STDOUT if capture else None,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        if on_start:
+            on_start(process)
+        captured_output, _ = process.communicate()
+        if captured_output:
+            log(captured_output, end="")
 
-        if result.returncode != 0:
+        if process.returncode != 0:
             # Wenn der Prozess mit einem Fehlercode beendet wird, lösen wir manuell eine Ausnahme aus.
-            raise subprocess.CalledProcessError(result.returncode, test_command)
+            raise subprocess.CalledProcessError(process.returncode, test_command)
 
-        print(">>> ✅ Alle Tests erfolgreich bestanden.")
+        log(">>> ✅ Alle Tests erfolgreich bestanden.")
+        _mark_tests_passed(source_hash)
         return True
     except FileNotFoundError as e:
-        print("\n" + "=" * 50)
-        print(f"FEHLER: Ein benötigter Befehl wurde nicht gefunden: '{e.filename}'")
-        print("Stellen Sie sicher, dass alle System-Abhängigkeiten (z.B. xvfb auf Linux) installiert sind.")
-        print("=" * 50 + "\n")
+        log("\n" + "=" * 50)
+        log(f"FEHLER: Ein benötigter Befehl wurde nicht gefunden: '{e.filename}'")
+        log("Stellen Sie sicher, dass alle System-Abhängigkeiten (z.B. xvfb auf Linux) installiert sind.")
+        log("=" * 50 + "\n")
         return False
     except subprocess.CalledProcessError as e:
-        print("\n" + "=" * 50)
-        print(f"FEHLER: Die Test-Suite ist mit Exit-Code {e.returncode} fehlgeschlagen.")
-        print("Die pytest-Ausgabe sollte direkt über dieser Nachricht sichtbar sein.")
-        print("Bitte beheben Sie die fehlschlagenden Tests.")
-        print("Stellen Sie sicher, dass Sie alle Abhängigkeiten installiert haben:")
-        print("  pip install -r requirements-dev.txt")
-        print("  pip install -r requirements-db.txt")
-        print("=" * 50 + "\n")
+        log("\n" + "=" * 50)
+        log(f"FEHLER: Die Test-Suite ist mit Exit-Code {e.returncode} fehlgeschlagen.")
+        log("Die pytest-Ausgabe sollte direkt über dieser Nachricht sichtbar sein.")
+        log("Bitte beheben Sie die fehlschlagenden Tests.")
+        log("Stellen Sie sicher, dass Sie alle Abhängigkeiten installiert haben:")
+        log("  pip install -r requirements-dev.txt")
+        log("  pip install -r requirements-db.txt")
+        log("=" * 50 + "\n")
         return False
 
 
-def clean_previous_builds(release_dir: pathlib.Path):
-    """Entfernt alte Build-Artefakte, um einen sauberen Build zu gewährleisten."""
-    print(">>> Schritt 1: Alte Build-Artefakte bereinigen...")
-
-    # Eine Liste von Pfaden, die gelöscht werden sollen.
-    zip_path = pathlib.Path(str(release_dir) + ".zip")
-    paths_to_clean = [release_dir, zip_path, BUILD_DIR, DIST_DIR, SPEC_FILE]
+def clean_previous_builds(release_dir: pathlib.Path, clean_build_cache: bool = False):
+    """
+    Entfernt alte Build-Artefakte, um einen sauberen Build zu gewährleisten.
 
-    for path in paths_to_clean:
-        if path.is_dir():
-            shutil.rmtree(path, ignore_errors=True)
-        elif path.is_file():
-            path.unlink(
-                missing_ok=True
-            )  # missing_ok=True verhindert Fehler, wenn die Datei nicht existiert.
+    Das build/-Verzeichnis von PyInstaller bleibt standardmäßig erhalten: PyInstaller
+    erkennt Änderungen selbst und verwendet die zwischengespeicherte Analyse sonst
+    wieder, was den teuersten Schritt des Builds spart.
 
+    Args:
+        release_dir (pathlib.Path): Das Release-Verzeichnis des aktuellen Builds.
+        clean_build_cache (bool): Auch den PyInstaller-Cache (build/) löschen.
+    """
+    print(">>> Schritt 1: Alte Build-Artefakte bereinigen...")
 
-def main():
-    """Führt den plattformspezifischen Build-Prozess aus."""
-    # --- Vorab-Prüfungen ---
-    print(">>> Schritt 0: Überprüfe Voraussetzungen...")
-    if not SCRIPT_NAME.is_file():
-        print(f"\nFEHLER: Hauptskript '{SCRIPT_NAME}' nicht gefunden.")
-        print("Stellen Sie sicher, dass Sie das Skript im Hauptverzeichnis des Projekts ausführen.")
-        sys.exit(1)
-
-    if not ASSETS_DIR.is_dir():
-        print(f"\nFEHLER: Asset-Verzeichnis '{ASSETS_DIR}' nicht gefunden.")
-        sys.exit(1)
+    # Eine Liste von Pfaden, die gelöscht werden sollen.
+    zip_path = release_dir.with_name(f"{release_dir.name}.zip")
+    paths_to_clean = [release_dir, zip_path, DIST_DIR, SPEC_FILE]
+    if clean_build_cache:
+        paths_to_clean.append(BUILD_DIR)
 
-    if not shutil.which("pyinstaller"):
-        print("\nFEHLER: Das Modul 'PyInstaller' wurde nicht gefunden.")
-        print(f"Bitte installieren Sie es in der aktiven Python-Umgebung ({sys.executable}) mit:")
-        print("pip install pyinstaller")
-        sys.exit(1)
+    # Die Pfade sind voneinander unabhängig; das Löschen ist I/O-gebunden und
+    # kann daher parallel in Threads erfolgen.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_remove_path, paths_to_clean))
 
-    # Prüfe installierte Pakete
-    if not check_installed_requirements():
-        sys.exit(1)
 
-    # Führe die Tests aus, bevor der Build-Prozess startet
-    if not run_tests():
-        sys.exit(1)
+def _remove_path(path: pathlib.Path):
+    """Löscht eine Datei oder ein Verzeichnis, falls vorhanden."""
+    # Ein einziger lstat-Aufruf statt is_dir() + is_file() (je ein eigener Syscall).
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if stat.S_ISDIR(st.st_mode):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def start_logged_process(command, log_path: pathlib.Path, **popen_kwargs):
+    """
+    Startet einen Prozess, dessen Ausgabe live angezeigt und in log_path gespeichert wird.
+
+    stdout und stderr werden zusammengeführt und von einem Hintergrund-Thread
+    zeilenweise an die Konsole und die Log-Datei weitergereicht.
+
+    Returns:
+        tuple: (subprocess.Popen, threading.Thread) - Der Prozess und der Lese-Thread.
+    """
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        **popen_kwargs,
+    )
+
+    def _pump_output():
+        with process.stdout, log_path.open("w", encoding="utf-8") as log_file:
+            for line in process.stdout:
+                sys.stdout.write(line)
+                log_file.write(line)
+
+    reader = threading.Thread(target=_pump_output, daemon=True)
+    reader.start()
+    return process, reader
+
+
+def _reflink(src: pathlib.Path, dest: pathlib.Path) -> bool:
+    """
+    Versucht eine Copy-on-Write-Kopie (Reflink) über das FICLONE-ioctl (nur Linux).
+
+    Returns:
+        bool: True, wenn der Reflink angelegt wurde.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
 
-    # --- Plattform- und Artefakt-Setup ---
-    system = platform.system()
-    release_dir = pathlib.Path(f"{APP_NAME}_{system}_v{VERSION}")
+    ficlone = 0x40049409  # _IOW(0x94, 9, int) aus linux/fs.h
+    try:
+        with src.open("rb") as fsrc, dest.open("wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), ficlone, fsrc.fileno())
+        return True
+    except OSError:
+        dest.unlink(missing_ok=True)
+        return False
 
-    print(f"\n>>> Erstelle Release für {system} v{VERSION}...")
 
-    clean_previous_builds(release_dir)
+def _link_or_copy(src: pathlib.Path, dest: pathlib.Path):
+    """
+    Legt einen Hardlink an und kopiert nur, wenn das nicht möglich ist.
 
-    # --- Schritt 2: Anwendung mit PyInstaller bauen ---
-    print("\n>>> Schritt 2: Anwendung mit PyInstaller bauen...")
+    Das Release-Verzeichnis wird nach dem Zippen wieder gelöscht, ein Hardlink
+    spart daher das Kopieren der Daten. Über Dateisystemgrenzen hinweg (oder auf
+    Dateisystemen ohne Hardlinks) wird ein Reflink versucht (Btrfs, XFS) und erst
+    danach auf eine normale Kopie zurückgegriffen.
+    """
+    try:
+        os.link(src, dest)
+    except OSError:
+        if _reflink(src, dest):
+            return
+        # copyfile statt copy: Rechte-Bits sind für diese Textdateien irrelevant, und
+        # unter Linux kopiert copyfile per os.sendfile direkt im Kernel.
+        shutil.copyfile(src, dest)
+
+
+def create_zip_archive(release_dir: pathlib.Path) -> pathlib.Path:
+    """
+    Packt das Release-Verzeichnis in ein ZIP-Archiv neben dem Verzeichnis.
+
+    Nutzt Deflate mit Level 1 statt des Standard-Levels 6 von shutil.make_archive:
+    Der Großteil des Archivs ist die bereits komprimierte PyInstaller-Datei.
+    """
+    zip_path = release_dir.with_name(f"{release_dir.name}.zip")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for path in sorted(release_dir.rglob("*")):
+            if not path.is_file():
+                continue
+            precompressed = (
+                path.suffix.lower() in PRECOMPRESSED_SUFFIXES
+                or path.stat().st_size > STORE_SIZE_THRESHOLD
+            )
+            compress_type = zipfile.ZIP_STORED if precompressed else zipfile.ZIP_DEFLATED
+            zf.write(path, path.relative_to(release_dir.parent), compress_type=compress_type)
+    return zip_path
+
+
+def parse_args(argv=None):
+    """Liest die Kommandozeilen-Optionen des Build-Skripts."""
+    parser = argparse.ArgumentParser(description=f"Erstellt ein Release-Paket von {APP_NAME}.")
+    parser.add_argument(
+        "--skip-tests",
+        action="store_true",
+        # Nur ausdrückliche Ja-Werte zählen, SKIP_BUILD_TESTS=0 führt die Tests also aus.
+        default=os.getenv("SKIP_BUILD_TESTS", "").lower() in {"1", "true", "yes"},
+        help="Test-Suite nicht ausführen (auch über SKIP_BUILD_TESTS=1).",
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="PyInstaller-Cache (build/) vor dem Build löschen.",
+    )
+    parser.add_argument(
+        "--force-tests",
+        action="store_true",
+        help="Test-Suite auch bei unverändertem Quellcode ausführen.",
+    )
+    return parser.parse_args(argv)
+
+
+def build_pyinstaller_command(system: str):
+    """
+    Stellt den PyInstaller-Aufruf und dessen Umgebung zusammen.
+
+    Returns:
+        tuple: (list[str], dict) - Der Befehl und die Umgebungsvariablen für den Prozess.
+    """
     # Dies ist die robusteste Methode, PyInstaller aufzurufen. Sie verwendet denselben
     # Python-Interpreter, der dieses Skript ausführt, und umgeht so PATH-Probleme.
     pyinstaller_command = [
@@ -210,38 +486,164 @@ def main():
     else:
         print(f"  -> Hinweis: Kein plattformspezifisches Icon für {system} gefunden oder benötigt.")
 
-    # Daten, die direkt in die ausführbare Datei gebündelt werden sollen (Data-driven).
-    data_to_add = [
-        (ASSETS_DIR, ASSETS_DIR),
-        (pathlib.Path("game_config.json"), pathlib.Path(".")),
-        (pathlib.Path("core/checkout_paths.json"), pathlib.Path("core")),
-        (pathlib.Path("alembic.ini"), pathlib.Path(".")),
-        (pathlib.Path("alembic"), pathlib.Path("alembic")),
-        (pathlib.Path("config.ini.example"), pathlib.Path(".")),
-    ]
-
     # Füge die --add-data Argumente hinzu, formatiert für PyInstaller.
-    for src, dest in data_to_add:
+    for src, dest in DATA_TO_ADD:
         pyinstaller_command.append(f"--add-data={src}{os.pathsep}{dest}")
 
     pyinstaller_command.append(str(SCRIPT_NAME))
 
-    print("Führe Befehl aus:")
-    print(f"  {' '.join(pyinstaller_command)}")
+    # Der vollständige Befehl wird nur bei BUILD_VERBOSE ausgegeben, dann aber
+    # korrekt gequotet und direkt kopierbar. shlex.join quotet für POSIX-Shells,
+    # unter Windows gelten die Regeln von list2cmdline (wie bei subprocess).
+    if os.getenv("BUILD_VERBOSE"):
+        command_str = (
+            subprocess.list2cmdline(pyinstaller_command)
+            if system == "Windows"
+            else shlex.join(pyinstaller_command)
+        )
+        print("Führe Befehl aus:")
+        print(f"  {command_str}")
+
+    # PyInstaller importiert beim Analysieren den kompletten Abhängigkeitsgraphen.
+    # Ohne Bytecode-Schreibzugriffe entstehen dabei keine verstreuten __pycache__-Dateien.
+    pyinstaller_env = os.environ.copy()
+    pyinstaller_env["PYTHONDONTWRITEBYTECODE"] = "1"
+    pyinstaller_env["PYTHONHASHSEED"] = "0"
+    return pyinstaller_command, pyinstaller_env
+
+
+def main():
+    """Führt den plattformspezifischen Build-Prozess aus."""
+    args = parse_args()
+
+    # --- Vorab-Prüfungen ---
+    print(">>> Schritt 0: Überprüfe Voraussetzungen...")
+    if not SCRIPT_NAME.is_file():
+        print(f"\nFEHLER: Hauptskript '{SCRIPT_NAME}' nicht gefunden.")
+        print("Stellen Sie sicher, dass Sie das Skript im Hauptverzeichnis des Projekts ausführen.")
+        sys.exit(1)
+
+    if not ASSETS_DIR.is_dir():
+        print(f"\nFEHLER: Asset-Verzeichnis '{ASSETS_DIR}' nicht gefunden.")
+        sys.exit(1)
+
+    # Alle zu bündelnden Daten vorab prüfen, statt erst mitten im PyInstaller-Lauf zu scheitern.
+    present_data = _collect_present_paths(src for src, _ in DATA_TO_ADD)
+    missing_data = [str(src) for src, _ in DATA_TO_ADD if src not in present_data]
+    if missing_data:
+        print(f"\nFEHLER: Folgende Daten für das Bundle fehlen: {', '.join(missing_data)}")
+        sys.exit(1)
+
+    # PyInstaller wird über 'sys.executable -m PyInstaller' aufgerufen, daher wird das Modul
+    # in der aktiven Umgebung gesucht (ohne es zu importieren) statt eines Skripts im PATH.
+    if importlib.util.find_spec("PyInstaller") is None:
+        print("\nFEHLER: Das Modul 'PyInstaller' wurde nicht gefunden.")
+        print(f"Bitte installieren Sie es in der aktiven Python-Umgebung ({sys.executable}) mit:")
+        print("pip install pyinstaller")
+        sys.exit(1)
+
+    # Prüfe installierte Pakete
+    if not check_installed_requirements():
+        sys.exit(1)
+
+    # --- Plattform- und Artefakt-Setup ---
+    system = platform.system()
+    release_dir = pathlib.Path(f"{APP_NAME}_{system}_v{VERSION}")
+
+    print(f"\n>>> Erstelle Release für {system} v{VERSION}...")
+
+    # Die Test-Suite läuft im Hintergrund, parallel zur Bereinigung und zu PyInstaller:
+    # Beide Schritte sind voneinander unabhängig, die Gesamtzeit sinkt so von
+    # "Tests + Build" auf etwa das Maximum der beiden. Vor Schritt 3 wird auf das
+    # Testergebnis gewartet.
+    # Mit --skip-tests oder SKIP_BUILD_TESTS (z.B. in CI, wo die Tests bereits in
+    # einer eigenen Stufe gelaufen sind) wird die Test-Suite nicht erneut ausgeführt.
+    # Die pytest-Ausgabe wird gesammelt und erst nach Abschluss der Tests am Stück
+    # ausgegeben, damit sie sich nicht mit der PyInstaller-Ausgabe vermischt.
+    tests_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    tests_output = io.StringIO()
+    test_processes = []
+    tests_cancelled = threading.Event()
+
+    def _register_test_process(process):
+        test_processes.append(process)
+        # Wurde der Build inzwischen abgebrochen, den gerade gestarteten Prozess sofort beenden.
+        if tests_cancelled.is_set():
+            process.terminate()
+
+    def _cancel_tests():
+        """Bricht die Test-Suite bei einem Fehler oder Strg+C ab."""
+        tests_cancelled.set()
+        tests_executor.shutdown(wait=False, cancel_futures=True)
+        for process in test_processes:
+            process.terminate()
+
+    if args.skip_tests:
+        print("\n>>> Schritt 0.5: Test-Suite übersprungen (--skip-tests / SKIP_BUILD_TESTS).")
+        tests_future = None
+    else:
+        print("\n>>> Schritt 0.5: Test-Suite wird im Hintergrund ausgeführt...")
+        tests_future = tests_executor.submit(
+            run_tests, args.force_tests, tests_output, _register_test_process
+        )
 
-    # Führe den Befehl aus und zeige die Ausgabe in Echtzeit an. KEIN capture_output.
     try:
-        subprocess.run(pyinstaller_command, check=True)
+        clean_previous_builds(release_dir, args.clean)
+
+        # --- Schritt 2: Anwendung mit PyInstaller bauen ---
+        print("\n>>> Schritt 2: Anwendung mit PyInstaller bauen...")
+        pyinstaller_command, pyinstaller_env = build_pyinstaller_command(system)
+
+        # Führe den Befehl aus und zeige die Ausgabe in Echtzeit an. Parallel wird sie in
+        # build.log mitgeschrieben, damit ein Fehler ohne erneuten Build analysiert werden kann.
+        process, log_reader = start_logged_process(
+            pyinstaller_command, BUILD_LOG, env=pyinstaller_env
+        )
+        # Auf POSIX-Systemen mit niedrigerer Priorität laufen lassen, damit das System
+        # bedienbar bleibt. (setpriority statt preexec_fn, da der Test-Thread bereits läuft.)
+        if os.name == "posix":
+            try:
+                os.setpriority(os.PRIO_PROCESS, process.pid, 5)
+            except OSError:
+                pass
+
+        # Warten, bis die Tests oder PyInstaller fertig sind. Scheitert PyInstaller
+        # zuerst, wird die noch laufende Test-Suite abgebrochen (siehe unten).
+        while tests_future and not tests_future.done() and process.poll() is None:
+            concurrent.futures.wait([tests_future], timeout=0.5)
+        if process.poll():
+            log_reader.join()
+            raise subprocess.CalledProcessError(process.returncode, pyinstaller_command)
+
+        # Schlagen die Tests fehl, wird der laufende Build sofort abgebrochen.
+        tests_passed = tests_future.result() if tests_future else True
+        tests_executor.shutdown()
+        print(tests_output.getvalue(), end="")
+        if not tests_passed:
+            process.terminate()
+            process.wait()
+            log_reader.join()
+            sys.exit(1)
+
+        returncode = process.wait()
+        log_reader.join()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, pyinstaller_command)
     except subprocess.CalledProcessError as e:
+        _cancel_tests()
         print("\n" + "=" * 50)
         print("FEHLER: PyInstaller ist mit einem Fehler fehlgeschlagen.")
         print(f"Exit-Code: {e.returncode}")
         print(
             "Bitte überprüfen Sie die obige Ausgabe von PyInstaller auf die genaue Fehlermeldung."
         )
+        print(f"Die vollständige Ausgabe wurde in '{BUILD_LOG}' gespeichert.")
         print("Stellen Sie sicher, dass alle Abhängigkeiten aus requirements.txt installiert sind.")
         print("=" * 50 + "\n")
         sys.exit(1)
+    except BaseException:
+        _cancel_tests()
+        raise
     print(">>> PyInstaller erfolgreich abgeschlossen.")
 
     # --- Schritt 3: Release-Verzeichnis erstellen und Dateien kopieren ---
@@ -259,7 +661,13 @@ def main():
 
     if source_artifact.exists():
         print(f"  -> Verschiebe Artefakt: '{source_artifact.name}' -> '{dest_artifact.name}'")
-        shutil.move(str(source_artifact), str(dest_artifact))
+        try:
+            # Gleiches Dateisystem (Normalfall): ein einziger rename-Syscall.
+            os.replace(source_artifact, dest_artifact)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(source_artifact, dest_artifact)
     else:
         print(f"FEHLER: Build-Artefakt '{source_artifact}' wurde nicht gefunden!")
         sys.exit(1)
@@ -269,16 +677,16 @@ def main():
         src = pathlib.Path(filename)
         if src.exists():
             print(f"  -> Kopiere '{src}' nach '{release_dir}'")
-            shutil.copy(src, release_dir)
+            _link_or_copy(src, release_dir / src.name)
 
     # --- Schritt 4 & 5: Finalisieren (ZIP oder für Installer vorbereiten) ---
     # --- Schritt 4: ZIP-Archiv erstellen ---
     print(f"\n>>> Schritt 4: ZIP-Archiv '{release_dir}.zip' erstellen...")
-    shutil.make_archive(str(release_dir), "zip", root_dir=".", base_dir=str(release_dir))
+    create_zip_archive(release_dir)
 
     # --- Schritt 5: Temporäre Build-Artefakte bereinigen ---
     print("\n>>> Schritt 5: Temporäre Build-Artefakte bereinigen...")
-    shutil.rmtree(BUILD_DIR)
+    # build/ bleibt als PyInstaller-Cache für den nächsten Build erhalten (siehe --clean).
     shutil.rmtree(DIST_DIR)
     SPEC_FILE.unlink(missing_ok=True)
     shutil.rmtree(release_dir)
@@ -54,6 +54,27 @@ class AIPlayer(Player):
         # 'Adaptive' wird hier nicht benötigt, da es seine Daten aus dem Profil lädt.
     }
 
+    # Schwierigkeitsgrade, bei denen die Strategien aggressiver zielen (z.B. Triple statt Single).
+    HIGH_SKILL_DIFFICULTIES = frozenset({"Profi", "Champion"})
+
+    # Anteil der Ringhöhe, um den die KI je nach Schwierigkeit Richtung Board-Mitte zielt.
+    STRATEGIC_OFFSET_PERCENTAGES = {
+        "Champion": 0.35,
+        "Profi": 0.3,
+        "Amateur": 0.25,
+        "Fortgeschritten": 0.2,
+        "Anfänger": 0.1,
+    }
+
+    # Kürzel für die Ziel-Namen der adaptiven KI (z.B. "T20", "D18", "BE").
+    _TARGET_NAME_PREFIXES = {
+        "Triple": "T",
+        "Double": "D",
+        "Single": "S",
+        "Bullseye": "BE",
+        "Bull": "B",
+    }
+
     # Das Strategy-Pattern in Aktion: Eine Map, die Spielmodi auf Strategie-Klassen abbildet.
     _strategy_map = {
         "301": X01AIStrategy,
@@ -86,10 +107,26 @@ class AIPlayer(Player):
         if game.settings_manager:
             self.throw_delay = game.settings_manager.get("ai_throw_delay", 1000)
 
+        # Gepufferte Offset-Distanzen je Ring als (skaliert, difficulty, {ring: distanz}).
+        # Wird neu berechnet, sobald das Board neu skaliert oder die Schwierigkeit geändert wird.
+        self._offset_distance_cache = None
+
         # Wählt die passende Strategie aus der Map aus oder nimmt die Default-Strategie.
         strategy_class = self._strategy_map.get(game.options.name, DefaultAIStrategy)
         self.strategy: AIStrategy = strategy_class(self)
 
+    @property
+    def difficulty(self) -> str:
+        """Der Schwierigkeitsgrad der KI."""
+        return self._difficulty
+
+    @difficulty.setter
+    def difficulty(self, value: str):
+        # Das abgeleitete Flag wird beim Setzen aktualisiert, damit die Strategien
+        # nicht bei jedem Wurf den String gegen mehrere Schwierigkeitsgrade vergleichen.
+        self._difficulty = value
+        self.is_high_skill = value in self.HIGH_SKILL_DIFFICULTIES
+
     def _apply_strategic_offset(self, center_coords: tuple[int, int], ring: str) -> tuple[int, int]:
         """
         Applies a small, strategic offset to the target coordinates to aim for
@@ -112,29 +149,37 @@ class AIPlayer(Player):
         # Vector from board center to target center
         vec_x = target_x - board_center_x
         vec_y = target_y - board_center_y
-        length = math.sqrt(vec_x**2 + vec_y**2) # type: ignore
+        length = math.hypot(vec_x, vec_y) # type: ignore
         if length == 0:
             return center_coords
 
         # The "safe" direction is opposite to the vector (towards the board center)
         # The offset is a fraction of the ring's height, depending on AI skill.
         skaliert = self.game.game_view_manager.dartboard.skaliert if self.game.game_view_manager else {}
-        ring_height = (skaliert or {}).get(f"{ring.lower()}_outer", 0) - (
-            skaliert or {}).get(f"{ring.lower()}_inner", 0)
-        offset_percentage = {
-            "Champion": 0.35,
-            "Profi": 0.3,
-            "Amateur": 0.25,
-            "Fortgeschritten": 0.2,
-            "Anfänger": 0.1,
-        }.get(self.difficulty, 0.1)
-        offset_distance = ring_height * offset_percentage # type: ignore
+        offset_distance = self._get_strategic_offset_distances(skaliert)[ring]
 
         # Um den Zielpunkt in Richtung Board-Mitte zu verschieben, subtrahieren wir # type: ignore
         # einen Teil des Vektors, der vom Zentrum zum Ziel zeigt.
-        return int(target_x - (vec_x / length) * offset_distance), int(
-            target_y - (vec_y / length) * offset_distance
-        )
+        scale = offset_distance / length
+        return int(target_x - vec_x * scale), int(target_y - vec_y * scale)
+
+    def _get_strategic_offset_distances(self, skaliert: dict | None) -> dict[str, float]:
+        """
+        Liefert die Offset-Distanz je Ring ("Triple", "Double") für die aktuelle
+        Board-Skalierung und Schwierigkeit. Das Ergebnis wird gepuffert, da sich beides
+        zwischen den Würfen praktisch nie ändert.
+        """
+        cache = self._offset_distance_cache
+        if cache is None or cache[0] is not skaliert or cache[1] != self.difficulty:
+            radii = skaliert or {}
+            offset_percentage = self.STRATEGIC_OFFSET_PERCENTAGES.get(self.difficulty, 0.1)
+            distances = {
+                ring: (radii.get(f"{ring.lower()}_outer", 0) - radii.get(f"{ring.lower()}_inner", 0))
+                * offset_percentage
+                for ring in ("Triple", "Double")
+            }
+            cache = self._offset_distance_cache = (skaliert, self.difficulty, distances)
+        return cache[2]
 
     def _get_adaptive_throw_coords(
         self, target_coords: tuple[int, int], target_name: str
@@ -187,8 +232,9 @@ class AIPlayer(Player):
         """Startet den automatischen Zug der KI."""
         self.game.game_view_manager = game_view_manager # Sicherstellen, dass die Referenz gesetzt ist
         self.throw_delay = game_view_manager.get_dartboard_throw_delay()
-        if game_view_manager.get_dartboard_root() and game_view_manager.get_dartboard_root().winfo_exists():
-            game_view_manager.get_dartboard_root().after(self.throw_delay, self._execute_throw, 1)
+        root = game_view_manager.get_dartboard_root()
+        if root and root.winfo_exists():
+            root.after(self.throw_delay, self._execute_throw, 1)
 
     def _execute_throw(self, throw_number: int):
         """
@@ -200,41 +246,38 @@ class AIPlayer(Player):
             # also die KI-Aktion abbrechen.
             return
 
+        # Die Attribut-Ketten zum View-Manager und zum Dartboard-Fenster werden einmal
+        # pro Wurf aufgelöst, statt sie bei jedem Zugriff erneut zu durchlaufen.
+        game_view_manager = self.game.game_view_manager
+        root = game_view_manager.get_dartboard_root() if game_view_manager else None
+
         if self.turn_is_over:
             # Der Zug wurde vorzeitig beendet (z.B. Bust im vorherigen Wurf),
             # also direkt zum nächsten Spieler wechseln.
-            if self.game.game_view_manager and self.game.game_view_manager.get_dartboard_root():
-                self.game.game_view_manager.get_dartboard_root().after(self.throw_delay, self.game.next_player) # type: ignore
+            if root:
+                root.after(self.throw_delay, self.game.next_player) # type: ignore
             return
 
         # --- Strategische Ziel-Logik ---
         ring, segment = self.strategy.get_target(throw_number)
         center_coords = (
-            self.game.game_view_manager.get_dartboard_coords_for_target(ring, segment) # type: ignore
-            if self.game.game_view_manager
+            game_view_manager.get_dartboard_coords_for_target(ring, segment) # type: ignore
+            if game_view_manager
             else (0, 0)
         )
         # Wende einen strategischen Offset an, um auf den "sicheren" Teil zu zielen
         target_coords = self._apply_strategic_offset(center_coords, ring)
 
         # Konstruiere den Ziel-Namen für die adaptive KI (z.B. "T20", "D18", "BE")
-        target_name_map = {
-            "Triple": "T",
-            "Double": "D",
-            "Single": "S",
-            "Bullseye": "BE",
-            "Bull": "B",
-        }
-        ring_prefix = target_name_map.get(ring, "S")
+        ring_prefix = self._TARGET_NAME_PREFIXES.get(ring, "S")
         target_name = ring_prefix if ring in ("Bullseye", "Bull") else f"{ring_prefix}{segment}"
 
         if target_coords:
             target_x, target_y = target_coords
         else:
             target_name = "BE"  # Ziele auf die Mitte
-            target_x, target_y = (self.game.game_view_manager.dartboard.center_x or 0), ( # type: ignore
-                self.game.game_view_manager.dartboard.center_y or 0 # type: ignore
-            ) # type: ignore
+            dartboard = game_view_manager.dartboard # type: ignore
+            target_x, target_y = (dartboard.center_x or 0), (dartboard.center_y or 0)
 
         # --- Wurf-Simulation basierend auf Schwierigkeit (Standard vs. Adaptiv) ---
         if self.difficulty == "Adaptiv" and self.profile and self.profile.accuracy_model is not None:
@@ -248,9 +291,11 @@ class AIPlayer(Player):
             if self.game.options.name == "Killer" and not self.state.get("life_segment"):
                 radius = self.DIFFICULTY_SETTINGS["Anfänger"]["radius"]
 
-            # Erzeugt eine zufällige Abweichung innerhalb eines Kreises um das Ziel
+            # Erzeugt eine zufällige Abweichung, gleichverteilt über die Kreisfläche um das Ziel.
+            # Die Wurzel gleicht aus, dass die Fläche eines Rings mit dem Radius wächst;
+            # ein gleichverteilter Abstand würde Würfe zur Zielmitte hin häufen.
             angle = random.uniform(0, 2 * math.pi)
-            dist = random.uniform(0, radius)
+            dist = radius * math.sqrt(random.uniform(0, 1))
             offset_x = dist * math.cos(angle)
             offset_y = dist * math.sin(angle)
 
@@ -258,11 +303,11 @@ class AIPlayer(Player):
             throw_y = int(target_y + offset_y)
 
         # --- Wurf an die Game-Logik übergeben, indem ein Klick simuliert wird ---
-        if self.game.game_view_manager:
+        if game_view_manager:
             # Nutze root.after mit Verzögerung 0, um die Klick-Simulation in die
             # Event-Queue einzureihen. Dies stellt sicher, dass die UI reagiert.
-            self.game.game_view_manager.get_dartboard_root().after(
-                0, self.game.game_view_manager.dartboard.simulate_click, throw_x, throw_y
+            root.after( # type: ignore
+                0, game_view_manager.dartboard.simulate_click, throw_x, throw_y
             )
 
         # --- Prüfung nach dem Wurf ---
@@ -273,13 +318,11 @@ class AIPlayer(Player):
             return
 
         # --- Nächsten Wurf planen oder Zug beenden ---
+        if not (root and root.winfo_exists()):
+            return
         if throw_number < 3:
             # Planen des nächsten Wurfs nach der Verzögerung
-            if self.game.game_view_manager.get_dartboard_root() and self.game.game_view_manager.get_dartboard_root().winfo_exists(): # type: ignore
-                self.game.game_view_manager.get_dartboard_root().after( # type: ignore
-                    self.throw_delay, self._execute_throw, throw_number + 1 # type: ignore
-                )
+            root.after(self.throw_delay, self._execute_throw, throw_number + 1)
         else:
             # Nach dem dritten Wurf den Zug an den nächsten Spieler übergeben
-            if self.game.game_view_manager.get_dartboard_root() and self.game.game_view_manager.get_dartboard_root().winfo_exists(): # type: ignore
-                self.game.game_view_manager.get_dartboard_root().after(self.throw_delay, self.game.next_player) # type: ignore
+            root.after(self.throw_delay, self.game.next_player)
@@ -20,56 +20,104 @@ from __future__ import annotations
 Dieses Modul implementiert das Strategy-Pattern für die KI-Zielauswahl.
 Jede Klasse repräsentiert eine spezifische Strategie für einen Spielmodus.
 """
-from .checkout_calculator import CheckoutCalculator
+import functools
+
+from .checkout_calculator import BOGEY_NUMBERS, CheckoutCalculator
+
+# Kandidaten für einen Setup-Wurf in der laufenden Aufnahme als (Ring, Segment, Punktwert),
+# von hoch nach niedrig. Einmalig beim Import erzeugt, statt die Liste bei jedem
+# Setup-Aufruf neu aufzubauen; der Punktwert spart den Aufruf von game.get_score.
+_SETUP_THROWS = tuple(("Triple", s, s * 3) for s in range(20, 0, -1)) + tuple(
+    ("Single", s, s) for s in range(20, 0, -1)
+)
+# Bevorzugte Lebensfelder im Killer-Modus, in der Reihenfolge der Wahl.
+_KILLER_PREFERRED_SEGMENTS = tuple(str(i) for i in range(20, 14, -1)) + ("Bull",)
+# Höchster Score, den der CheckoutCalculator mit der jeweiligen Anzahl Darts noch
+# auscheckt (über alle Opt-Out-Regeln). Darüber ist keine Abfrage nötig.
+_MAX_CHECKOUT_BY_DARTS = {1: 60, 2: 110, 3: 170}
+# Fertige Ziel-Tupel für die einfachen Strategien, damit pro KI-Wurf kein neues
+# Tupel entsteht. Index = Segment (0 bleibt als Platzhalter ungenutzt).
+_BULLSEYE = ("Bullseye", 50)
+_TARGETS_BY_RING = {
+    ring: tuple((ring, i) for i in range(21)) for ring in ("Single", "Double", "Triple")
+}
+_TRIPLE_BY_SEG = _TARGETS_BY_RING["Triple"]
+# Wurfziel je Cricket-/Tactics-Ziel, getrennt nach dem Ring, auf den die KI zielt.
+# Auf Bull wird immer das Bullseye anvisiert.
+_CRICKET_AIM = {
+    ring: {"Bull": _BULLSEYE, **{str(n): _TARGETS_BY_RING[ring][n] for n in range(10, 21)}}
+    for ring in ("Single", "Triple")
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_checkout_target(
+    score: int, opt_out: str, darts_left: int, preferred_double: int | None
+) -> tuple[str, int] | None:
+    """
+    Liefert das erste Ziel des Checkout-Vorschlags oder None.
+    Der Vorschlag hängt nur von diesen vier Werten ab, die sich innerhalb eines
+    Matches ständig wiederholen; der Calculator liefert den Weg bereits strukturiert.
+    """
+    checkout_targets = CheckoutCalculator.get_checkout_targets(
+        score, opt_out, darts_left, preferred_double=preferred_double
+    )
+    if checkout_targets:
+        return checkout_targets[0]
+    return None
 
 
 class AIStrategy:
     """Basisklasse für alle KI-Strategien."""
 
+    # Strategien werden pro KI-Spieler erzeugt und halten nur wenige feste Attribute.
+    __slots__ = ("ai_player", "game", "_opponents_source", "_opponents_len", "_opponents")
+
     def __init__(self, ai_player):
         self.ai_player = ai_player
         self.game = ai_player.game
+        self._opponents_source = None
+        self._opponents_len = 0
+        self._opponents = []
+
+    def _get_opponents(self) -> list:
+        """
+        Gibt die Gegner der KI zurück (alle Spieler außer ihr selbst).
+
+        Die Liste wird zwischengespeichert und nur neu aufgebaut, wenn sich
+        die Spielerliste ändert (neue Liste oder ein Spieler hat das Spiel
+        verlassen).
+        """
+        players = self.game.players
+        # Identitätsvergleich statt id(): eine freigegebene Liste könnte ihre id
+        # an eine neue Liste weitergeben.
+        if players is not self._opponents_source or len(players) != self._opponents_len:
+            self._opponents = [p for p in players if p != self.ai_player]
+            self._opponents_source = players
+            self._opponents_len = len(players)
+        return self._opponents
 
     def get_target(self, throw_number: int) -> tuple[str, int]:
         """Gibt das Ziel als (Ring, Segment)-Tupel zurück."""
         raise NotImplementedError("Diese Methode muss in der Unterklasse implementiert werden.")
 
-    def _parse_target_string(self, target_str: str) -> tuple[str, int]:
-        """Hilfsmethode zum Parsen von Ziel-Strings (z.B. "T20")."""
-        target_str = target_str.strip().upper()
-        if target_str in ("BULLSEYE", "BE", "BULL"):
-            return "Bullseye", 50
-        if target_str == "B":
-            return "Bullseye", 50
-        ring_map = {"T": "Triple", "D": "Double", "S": "Single"}
-        ring_char = target_str[0]
-        if ring_char in ring_map:
-            try:
-                return ring_map[ring_char], int(target_str[1:])
-            except (ValueError, IndexError):
-                pass
-        try:
-            return "Single", int(target_str)
-        except ValueError:
-            pass
-        return "Triple", 20  # Fallback
-
 
 class X01AIStrategy(AIStrategy):
     """Strategie für X01-Spiele."""
 
+    __slots__ = ()
+
     # Bogey-Nummern: Scores, die nicht mit 3 Darts gefinished werden können.
     # Die "2" wurde entfernt, da D1 ein valides, wenn auch schwieriges, Finish ist
     # und die KI in der Lage sein muss, es zu versuchen.
-    BOGEY_NUMBERS = {169, 168, 166, 165, 163, 162, 159}
+    BOGEY_NUMBERS = BOGEY_NUMBERS
 
     def _get_high_skill_target(self, score: int, darts_left: int) -> tuple[str, int] | None:
         """
         Prüft und wendet priorisierte Regeln für starke KI-Spieler an.
         Gibt ein Ziel zurück, wenn eine Regel zutrifft, sonst None.
         """
-        is_high_skill = self.ai_player.difficulty in ("Profi", "Champion")
-        if not (is_high_skill and self.game.options.opt_out == "Double"):
+        if not (self.ai_player.is_high_skill and self.game.options.opt_out == "Double"):
             return None
         # Regel 2: Strategischer Bust, um ein Finish auf D1 zu vermeiden
         if score == 3 and darts_left > 1:
@@ -125,65 +173,62 @@ class X01AIStrategy(AIStrategy):
         Versucht, einen direkten Checkout-Pfad zu finden.
         Gibt das erste Ziel des Pfades zurück oder None, wenn kein Pfad existiert.
         """
-        checkout_path_str = CheckoutCalculator.get_checkout_suggestion(
-            score, self.game.options.opt_out, darts_left, preferred_double=preferred_double
+        if score > _MAX_CHECKOUT_BY_DARTS.get(darts_left, 0):
+            return None
+        return _cached_checkout_target(
+            score, self.game.options.opt_out, darts_left, preferred_double
         )
-        if checkout_path_str and checkout_path_str != "-":
-            first_target_str = checkout_path_str.split(", ")[0]
-            return self._parse_target_string(first_target_str)
-        return None
 
     def _get_setup_target(self, score: int, darts_left: int, preferred_double: int | None) -> tuple[str, int]:
         """
         Bestimmt ein intelligentes Setup-Ziel, wenn kein direkter Checkout möglich ist.
         """
-        # Fall A: Setup für DIESE Runde (wenn noch mehr als 1 Dart übrig ist)
-        if darts_left > 1:
-            all_possible_throws = [("Triple", s) for s in range(20, 0, -1)] + [
-                ("Single", s) for s in range(20, 0, -1)
-            ]
-            for ring, segment in all_possible_throws:
-                throw_value = self.game.get_score(ring, segment)
-                if score - throw_value < 2:
+        # Fall A: Setup für DIESE Runde (wenn noch mehr als 1 Dart übrig ist).
+        # Unter 3 Punkten lässt kein Wurf einen Rest von mindestens 2 übrig.
+        if darts_left > 1 and score >= 3:
+            # Schleifen-Invarianten einmal auflösen statt pro Kandidat.
+            opt_out = self.game.options.opt_out
+            avoid_d1 = opt_out == "Double"
+            # Finish-Tabelle für den Rest nach diesem Wurf (Index = Rest, max. 170).
+            finishable = CheckoutCalculator.build_reachability_table(
+                opt_out, darts_left - 1, preferred_double
+            )
+            for ring, segment, throw_value in _SETUP_THROWS:
+                remainder = score - throw_value
+                if remainder < 2 or remainder > 170:
                     continue
 
-                remainder = score - throw_value
-                if (
-                    CheckoutCalculator.get_checkout_suggestion(
-                        remainder, self.game.options.opt_out, darts_left - 1, preferred_double=preferred_double
-                    )
-                    != "-"
-                ):
-                    # Vermeide es, D1 zu hinterlassen, wenn es nicht der letzte Dart ist
-                    if (
-                        (darts_left - 1) > 0
-                        and remainder == 2
-                        and self.game.options.opt_out == "Double"
-                    ):
-                        continue
+                # Vermeide es, D1 zu hinterlassen (in Fall A bleibt immer mindestens ein
+                # Dart übrig). Wird vor der Checkout-Abfrage geprüft, da der Kandidat
+                # ohnehin verworfen würde.
+                if remainder == 2 and avoid_d1:
+                    continue
+
+                if finishable[remainder]:
                     return ring, segment
 
         # Fall B: Setup für die NÄCHSTE Runde (letzter Dart or kein Setup in dieser Runde gefunden)
         # Ziel: Eine "gute" gerade Zahl hinterlassen. Geworfen wird auf sichere Single-Felder.
-        safe_targets = list(range(20, 0, -1))
-
-        # Priorität B.1: Versuche das bevorzugte Double exakt zu stellen
+        # Priorität B.1: Versuche das bevorzugte Double exakt zu stellen.
+        # Das passende Single-Feld ergibt sich direkt aus der Differenz.
         if preferred_double:
             double_value = 50 if preferred_double == 25 else preferred_double * 2
-            for segment_value in safe_targets:
-                if score - segment_value == double_value:
-                    return "Single", segment_value
-
-        # Priorisiere Würfe, die einen geraden Rest hinterlassen.
-        for segment_value in safe_targets:
-            if score - segment_value >= 2 and (score - segment_value) % 2 == 0:
+            segment_value = score - double_value
+            if 1 <= segment_value <= 20:
                 return "Single", segment_value
 
-        # Fallback: Wenn kein Wurf einen geraden Rest hinterlässt,
-        # nimm den höchsten möglichen Single-Wurf.
-        for segment_value in safe_targets:
-            if score - segment_value >= 2:
-                return "Single", segment_value
+        # Höchstes Single-Feld, das noch einen Rest von mindestens 2 übrig lässt.
+        highest_single = min(20, score - 2)
+        if highest_single >= 1:
+            # Priorisiere Würfe, die einen geraden Rest hinterlassen: Das ist das höchste Feld
+            # mit derselben Parität wie der Score, also highest_single oder eins darunter.
+            even_leave_single = highest_single - (score - highest_single) % 2
+            if even_leave_single >= 1:
+                return "Single", even_leave_single
+
+            # Fallback: Wenn kein Wurf einen geraden Rest hinterlässt,
+            # nimm den höchsten möglichen Single-Wurf.
+            return "Single", highest_single
 
         # Absoluter Notfall-Fallback (sollte nie passieren, wenn score >= 2 ist)
         return "Single", 1
@@ -222,60 +267,121 @@ class X01AIStrategy(AIStrategy):
 class CricketAIStrategy(AIStrategy):
     """Strategie für Cricket-Spiele."""
 
-    def _get_defensive_target(self, targets: list[str], opponents: list) -> tuple[str, int] | None:
+    __slots__ = (
+        "_targets",
+        "_target_bits",
+        "_all_targets_mask",
+    )
+
+    def __init__(self, ai_player):
+        super().__init__(ai_player)
+        # Die Cricket-Ziele stehen für das ganze Spiel fest. Sie werden beim ersten Wurf
+        # übernommen, da die Spiellogik beim Erstellen der KI noch nicht existiert.
+        # Jedes Ziel erhält ein Bit (in Spielreihenfolge); geschlossene Ziele eines
+        # Spielers werden als Bitmaske dargestellt.
+        self._targets = None
+        self._target_bits = {}
+        self._all_targets_mask = 0
+
+    def _init_targets(self) -> tuple[str, ...]:
+        targets = self._targets = tuple(self.game.game.get_targets())
+        self._target_bits = {t: 1 << i for i, t in enumerate(targets)}
+        self._all_targets_mask = (1 << len(targets)) - 1
+        return targets
+
+    def _get_closed_mask(self, player) -> int:
+        """
+        Gibt die Bitmaske der Ziele zurück, die der Spieler geschlossen hat.
+
+        Die Cricket-Logik pflegt diese Maske beim Wurf in `state["closed_mask"]`
+        (gleiche Bitreihenfolge). Fehlt sie, wird sie aus den Treffern gebildet.
+        """
+        state = getattr(player, "state", None)
+        if isinstance(state, dict):
+            mask = state.get("closed_mask")
+            if mask is not None:
+                return mask
+        bits = self._target_bits
+        mask = 0
+        for target, hits in player.hits.items():
+            if hits >= 3:
+                mask |= bits.get(target, 0)
+        return mask
+
+    def _get_opponent_masks(self, opponents) -> tuple[int, int]:
+        """
+        Gibt (von mindestens einem Gegner geschlossene Ziele, bei mindestens einem
+        Gegner offene Ziele) als Bitmasken zurück.
+
+        Die Masken werden bei jedem Dart neu gebildet (wenige Bit-Operationen pro
+        Gegner), damit Änderungen durch Undo oder ein geladenes Spiel sofort greifen.
+        """
+        opp_closed = 0
+        if opponents:
+            closed_by_all = self._all_targets_mask
+            for opp in opponents:
+                mask = self._get_closed_mask(opp)
+                opp_closed |= mask
+                closed_by_all &= mask
+            # Offen bei mindestens einem Gegner heißt: nicht von allen Gegnern geschlossen.
+            opp_open = self._all_targets_mask & ~closed_by_all
+        else:
+            opp_open = 0
+        return opp_closed, opp_open
+
+    def _aim_at(self, target: str) -> tuple[str, int]:
+        return _CRICKET_AIM["Triple" if self.ai_player.is_high_skill else "Single"][target]
+
+    def _get_defensive_target(self, my_closed: int, opp_closed: int) -> tuple[str, int] | None:
         """
         Sucht ein defensives Ziel: Schließe ein Ziel, auf dem ein Gegner punktet.
         Gibt das Ziel zurück oder None, wenn keine defensive Aktion nötig ist.
         """
-        dangerous_targets = [
-            t
-            for t in targets
-            if self.ai_player.hits.get(t, 0) < 3
-            and any(opp.hits.get(t, 0) >= 3 for opp in opponents)
-        ]
-        if not dangerous_targets:
+        # Gefährlich sind Ziele, die ein Gegner geschlossen hat, wir aber noch nicht.
+        if not opp_closed & ~my_closed:
             return None
+        for target, bit in self._target_bits.items():
+            if bit & opp_closed and not bit & my_closed:
+                return self._aim_at(target)
+        return None
 
-        target_segment = dangerous_targets[0]
-        if target_segment == "Bull":
-            return "Bullseye", 50
-
-        ring = "Triple" if self.ai_player.difficulty in ("Profi", "Champion") else "Single"
-        return ring, int(target_segment)
-
-    def _get_offensive_target(self, targets: list[str]) -> tuple[str, int] | None:
+    def _get_offensive_target(self, my_closed: int) -> tuple[str, int] | None:
         """
         Sucht ein offensives Ziel: Schließe das nächste eigene offene Ziel.
         Gibt das Ziel zurück oder None, wenn alle eigenen Ziele geschlossen sind.
         """
-        for target in targets:
-            if self.ai_player.hits.get(target, 0) < 3:
-                if target == "Bull":
-                    return "Bullseye", 50
-                ring = "Triple" if self.ai_player.difficulty in ("Profi", "Champion") else "Single"
-                return ring, int(target)
+        for target, bit in self._target_bits.items():
+            if not bit & my_closed:
+                return self._aim_at(target)
         return None
 
-    def _get_scoring_target(self, targets: list[str], opponents: list) -> tuple[str, int] | None:
+    def _get_scoring_target(self, my_closed: int, opp_open: int) -> tuple[str, int] | None:
         """
         Sucht ein Ziel zum Punkten: Wirf auf ein eigenes geschlossenes Ziel,
         das bei einem Gegner noch offen ist.
         """
-        for target in targets:
-            if self.ai_player.hits.get(target, 0) >= 3 and any(opp.hits.get(target, 0) < 3 for opp in opponents):
-                if target == "Bull":
-                    return "Bullseye", 50
-                ring = "Triple" if self.ai_player.difficulty in ("Profi", "Champion") else "Single"
-                return ring, int(target)
+        if not my_closed & opp_open:
+            return None
+        for target, bit in self._target_bits.items():
+            if bit & my_closed and bit & opp_open:
+                return self._aim_at(target)
         return None
 
     def get_target(self, throw_number: int) -> tuple[str, int]:
         """Bestimmt das strategische Ziel für Cricket basierend auf einer Phasenlogik."""
-        targets = self.game.game.get_targets()
-        opponents = [p for p in self.game.players if p != self.ai_player]
+        if self._targets is None:
+            self._init_targets()
+        opponents = self._get_opponents()
+
+        # Trefferstand einmal pro Aufruf auswerten, statt ihn in jeder Phase erneut
+        # für alle Gegner abzufragen: eigene geschlossene Ziele, Ziele, die mindestens
+        # ein Gegner geschlossen hat, und Ziele, die bei mindestens einem Gegner offen sind.
+        # Die Masken entstehen direkt aus den Treffer-Maps; fehlende Ziele gelten als offen.
+        my_closed = self._get_closed_mask(self.ai_player)
+        opp_closed, opp_open = self._get_opponent_masks(opponents)
 
         # Phase 1: Defensive - Verhindere, dass Gegner punkten.
-        if target := self._get_defensive_target(targets, opponents):
+        if target := self._get_defensive_target(my_closed, opp_closed):
             return target
 
         # Bestimme, ob wir Punkte benötigen, um die Führung zu übernehmen oder zu halten
@@ -296,15 +402,15 @@ class CricketAIStrategy(AIStrategy):
 
         # Phase 2: Scoring (nur wenn nötig) - Punkte sammeln auf bereits geschlossenen Feldern.
         if needs_points:
-            if target := self._get_scoring_target(targets, opponents):
+            if target := self._get_scoring_target(my_closed, opp_open):
                 return target
 
         # Phase 3: Offensive - Schließe eigene Ziele.
-        if target := self._get_offensive_target(targets):
+        if target := self._get_offensive_target(my_closed):
             return target
 
         # Phase 4: Scoring (Fallback) - Erziele Punkte auf offenen Zielen, wenn alles andere erledigt ist.
-        if target := self._get_scoring_target(targets, opponents):
+        if target := self._get_scoring_target(my_closed, opp_open):
             return target
 
         return "Bullseye", 50  # Fallback
@@ -313,24 +419,36 @@ class CricketAIStrategy(AIStrategy):
 class KillerAIStrategy(AIStrategy):
     """Strategie für Killer."""
 
+    __slots__ = ()
+
+    @staticmethod
+    def _normalize_segment(s) -> str:
+        val = str(s)
+        return "Bull" if val in ("Bull", "25", "50", "Bullseye") else val
+
+    def _get_taken_segments(self) -> frozenset[str]:
+        """
+        Gibt die bereits vergebenen Lebensfelder zurück.
+
+        Die Menge wird bewusst bei jedem Dart neu gebildet: Sie umfasst höchstens
+        einen Eintrag pro Spieler, und ein Cache über die Aufnahme hinweg würde bei
+        Undo oder einem geladenen Spiel veraltete Lebensfelder liefern.
+        """
+        return frozenset(
+            self._normalize_segment(p.state.get("life_segment"))
+            for p in self.game.players
+            if p.state.get("life_segment")
+        )
+
     def get_target(self, throw_number: int) -> tuple[str, int]:
         player_state = self.ai_player.state
         is_killer = bool(player_state.get("can_kill"))
         my_segment = player_state.get("life_segment")
 
-        def normalize_segment(s):
-            val = str(s)
-            return "Bull" if val in ("Bull", "25", "50", "Bullseye") else val
-
         # Phase 1: Lebensfeld bestimmen (Nur wenn wir noch keins haben und kein Killer sind)
         if not is_killer and not my_segment:
-            taken = {
-                normalize_segment(p.state.get("life_segment"))
-                for p in self.game.players
-                if p.state.get("life_segment")
-            }
-            preferred = [str(i) for i in range(20, 14, -1)] + ["Bull"]
-            for target in preferred:
+            taken = self._get_taken_segments()
+            for target in _KILLER_PREFERRED_SEGMENTS:
                 if target not in taken:
                     # Korrektur: Um die Chance zu maximieren, das Bull-Segment zu treffen,
                     # sollte auf das Bullseye gezielt werden.
@@ -347,20 +465,21 @@ class KillerAIStrategy(AIStrategy):
             return "Double", int(my_segment)
 
         # Phase 3: Als Killer agieren
-        opponents = [p for p in self.game.players if p != self.ai_player and p.score > 0]
+        opponents = [p for p in self._get_opponents() if p.score > 0]
         if not opponents:
             return ("Bullseye", 50)
 
-        # Priorisiere Gegner, die ebenfalls Killer sind.
-        killer_opponents = [p for p in opponents if p.state.get("can_kill")]
-
-        victim = None
-        if killer_opponents:
-            # Unter den Killern, greife den mit den meisten Leben an.
-            victim = max(killer_opponents, key=lambda p: p.score)
-        elif opponents:
-            # Wenn es keine anderen Killer gibt, greife den Spieler mit den meisten Leben an.
-            victim = max(opponents, key=lambda p: p.score)
+        # Priorisiere Gegner, die ebenfalls Killer sind: Unter den Killern wird der mit den
+        # meisten Leben angegriffen, gibt es keine, der Spieler mit den meisten Leben.
+        # Beides wird in einem Durchlauf ermittelt (bei Gleichstand gewinnt der Erste).
+        best_killer = best_any = None
+        for opp in opponents:
+            opp_score = opp.score
+            if best_any is None or opp_score > best_any.score:
+                best_any = opp
+            if opp.state.get("can_kill") and (best_killer is None or opp_score > best_killer.score):
+                best_killer = opp
+        victim = best_killer or best_any
 
         victim_segment = victim.state.get("life_segment")
         if not victim_segment:
@@ -369,12 +488,16 @@ class KillerAIStrategy(AIStrategy):
 
         # Korrektur: Wenn das Ziel "Bull" ist, ziele auf das größere Bullseye,
         # da sowohl Bull als auch Bullseye als Treffer zählen.
-        return ("Bullseye", 50) if normalize_segment(victim_segment) == "Bull" else ("Double", int(victim_segment))
+        if self._normalize_segment(victim_segment) == "Bull":
+            return ("Bullseye", 50)
+        return ("Double", int(victim_segment))
 
 
 class ShanghaiAIStrategy(AIStrategy):
     """Strategie für Shanghai."""
 
+    __slots__ = ()
+
     def get_target(self, throw_number: int) -> tuple[str, int]:
         """
         Zielt immer auf das Ziel der aktuellen Runde.
@@ -382,15 +505,17 @@ class ShanghaiAIStrategy(AIStrategy):
         """
         target_segment = self.game.round
         if 1 <= target_segment <= 20:
-            return "Triple", target_segment
+            return _TRIPLE_BY_SEG[target_segment]
 
         # Fallback, falls die Runde außerhalb des normalen Bereichs liegt (sollte nicht passieren)
-        return "Bullseye", 50
+        return _BULLSEYE
 
 
 class AtcAIStrategy(AIStrategy):
     """Strategie für Around the Clock."""
 
+    __slots__ = ()
+
     def get_target(self, throw_number: int) -> tuple[str, int]:
         """
         Zielt immer auf das nächste erforderliche Segment in der Sequenz.
@@ -400,23 +525,27 @@ class AtcAIStrategy(AIStrategy):
         target_segment_str = self.ai_player.next_target
         if not target_segment_str:
             # Fallback, falls kein Ziel gesetzt ist (sollte nicht passieren)
-            return "Bullseye", 50
+            return _BULLSEYE
 
         if target_segment_str == "Bull":
-            return "Bullseye", 50
+            return _BULLSEYE
 
         try:
             target_segment = int(target_segment_str)
             required_ring = self.game.options.opt_atc
+            if 1 <= target_segment <= 20 and required_ring in _TARGETS_BY_RING:
+                return _TARGETS_BY_RING[required_ring][target_segment]
             return required_ring, target_segment
         except (ValueError, AttributeError):
             # Fallback bei unerwarteten Daten
-            return "Bullseye", 50
+            return _BULLSEYE
 
 
 class SplitScoreAIStrategy(AIStrategy):
     """Strategie für das Trainingsspiel Split Score."""
 
+    __slots__ = ()
+
     def get_target(self, throw_number: int) -> tuple[str, int]:
         """
         Ermittelt das korrekte Ziel für die aktuelle Runde basierend auf der
@@ -428,11 +557,13 @@ class SplitScoreAIStrategy(AIStrategy):
         if 0 <= round_index < len(targets):
             return targets[round_index]
 
-        return "Bullseye", 50  # Fallback
+        return _BULLSEYE  # Fallback
 
 
 class DefaultAIStrategy(AIStrategy):
     """Fallback-Strategie, die immer auf das Bullseye zielt."""
 
+    __slots__ = ()
+
     def get_target(self, throw_number: int) -> tuple[str, int]:
-        return "Bullseye", 50
+        return _BULLSEYE
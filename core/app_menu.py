@@ -17,6 +17,35 @@
 from tkinter import Menu
 
 
+# Menüaufbau als Tabelle: (Label, Name der Controller-Methode).
+# Ein Eintrag (None, None) steht für eine Trennlinie.
+FILE_MENU_SPEC = (
+    ("Neues Spiel", "new_game"),
+    ("Spiel laden", "load_game"),
+    ("Spiel speichern", "save_game"),
+    (None, None),
+    ("Neues Turnier", "new_tournament"),
+    ("Turnier laden", "load_tournament"),
+    ("Turnier speichern", "save_tournament"),
+    (None, None),
+    ("Einstellungen", "open_settings_dialog"),
+    (None, None),
+    ("Spiel beenden", "quit_game"),
+)
+
+DB_MENU_SPEC = (
+    ("Spielerprofile verwalten...", "open_profile_manager"),
+    ("Spielerstatistiken anzeigen...", "show_player_stats"),
+    ("Highscores anzeigen...", "show_highscores"),
+)
+
+ABOUT_MENU_SPEC = (
+    ("Über Dartcounter", "about"),
+    (None, None),
+    ("Entwicklung unterstützen...", "open_donate_link"),
+)
+
+
 class AppMenu:
     """Erstellt und verwaltet die Hauptmenüleiste der Anwendung."""
 
@@ -26,46 +55,28 @@ class AppMenu:
         self.db_available = db_available
         self._create_menu()
 
+    def _add_submenu(self, menu_bar, label, spec):
+        """Erstellt ein Untermenü aus einer Tabelle von (Label, Methodenname)-Einträgen."""
+        submenu = Menu(menu_bar, tearoff=0)
+        menu_bar.add_cascade(label=label, menu=submenu)
+        for item_label, command_name in spec:
+            if item_label is None:
+                submenu.add_separator()
+            else:
+                submenu.add_command(
+                    label=item_label, command=getattr(self.controller, command_name)
+                )
+        return submenu
+
     def _create_menu(self):
         menu_bar = Menu(self.root)
 
-        # Datei Menü
-        file_menu = Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="Datei", menu=file_menu)
-        file_menu.add_command(label="Neues Spiel", command=self.controller.new_game)
-        file_menu.add_command(label="Spiel laden", command=self.controller.load_game)
-        file_menu.add_command(label="Spiel speichern", command=self.controller.save_game)
-        file_menu.add_separator()
-        file_menu.add_command(label="Neues Turnier", command=self.controller.new_tournament)
-        file_menu.add_command(label="Turnier laden", command=self.controller.load_tournament)
-        file_menu.add_command(label="Turnier speichern", command=self.controller.save_tournament)
-        file_menu.add_separator()
-        file_menu.add_command(label="Einstellungen", command=self.controller.open_settings_dialog)
-        file_menu.add_separator()
-        file_menu.add_command(label="Spiel beenden", command=self.controller.quit_game)
+        self._add_submenu(menu_bar, "Datei", FILE_MENU_SPEC)
 
         # Datenbank Menü (nur erstellen, wenn die DB verfügbar ist)
         if self.db_available:
-            db_menu = Menu(menu_bar, tearoff=0)
-            menu_bar.add_cascade(label="Datenbank", menu=db_menu)
-            db_menu.add_command(
-                label="Spielerprofile verwalten...",
-                command=self.controller.open_profile_manager,
-            )
-            db_menu.add_command(
-                label="Spielerstatistiken anzeigen...",
-                command=self.controller.show_player_stats,
-            )
-            db_menu.add_command(label="Highscores anzeigen...", command=self.controller.show_highscores)
+            self._add_submenu(menu_bar, "Datenbank", DB_MENU_SPEC)
 
-        # Über Menü
-        about_menu = Menu(menu_bar, tearoff=0)
-        menu_bar.add_cascade(label="Über", menu=about_menu)
-        about_menu.add_command(label="Über Dartcounter", command=self.controller.about)
-        about_menu.add_separator()
-        about_menu.add_command(
-            label="Entwicklung unterstützen...",
-            command=self.controller.open_donate_link,
-        )
+        self._add_submenu(menu_bar, "Über", ABOUT_MENU_SPEC)
 
         self.root.config(menu=menu_bar)
@@ -45,44 +45,84 @@ ATC_TARGET_VALUES = {
     "Bull": 25,
 }
 
-ATC_SEGMENTS_AS_STR = [str(s) for s in range(1, 21)]  # "1" bis "20"
+# Spielreihenfolge als unveränderliches Tupel, das alle Spiele gemeinsam nutzen können.
+ATC_TARGETS = tuple(ATC_TARGET_VALUES)
+
+# Ein Bit pro Ziel (Bit i = i-tes Ziel der Spielreihenfolge). Der Fortschritt eines
+# Spielers wird zusätzlich zur Treffer-Map als Bitmaske in state["hits_mask"] geführt.
+ATC_TARGET_BITS = {target: 1 << i for i, target in enumerate(ATC_TARGETS)}
+ATC_ALL_TARGETS_MASK = (1 << len(ATC_TARGETS)) - 1
+
+# Ringe, die je nach Option als Treffer auf ein Zahlenfeld zählen.
+_VALID_RINGS_BY_OPTION = {
+    "Single": frozenset({"Single", "Double", "Triple"}),
+    "Double": frozenset({"Double"}),
+    "Triple": frozenset({"Triple"}),
+}
+_BULL_RINGS = frozenset({"Bull", "Bullseye"})
+
+ATC_SEGMENTS_AS_STR = tuple(map(str, range(1, 21)))  # "1" bis "20"
 
 
 class AtC(GameLogicBase):
     def __init__(self, game):
         super().__init__(game)
         self.opt_atc = game.options.opt_atc
-        self.targets = [k for k in ATC_TARGET_VALUES.keys()]
+        self.targets = ATC_TARGETS
+        # Gültige Ringe und Präfix der Hinweis-Nachricht hängen nur von der Option ab.
+        self._valid_rings = _VALID_RINGS_BY_OPTION.get(self.opt_atc, frozenset({self.opt_atc}))
+        self._opt_atc_prefix = "" if self.opt_atc == "Single" else f"{self.opt_atc} "
 
     def initialize_player_state(self, player):
         """
         Setzt den Anfangs-Score auf 0, initialisiert die Treffer-Map und das erste Ziel.
         """
         player.score = 0
+        # Eigene Treffer-Map pro Spieler (die Vorlage in Player.INITIAL_STATE ist geteilt).
+        player.state["hits"] = dict.fromkeys(self.targets, 0)
+        player.state["hits_mask"] = 0
         if self.targets:
             player.next_target = self.targets[0]
-            for target in self.targets:
-                player.hits[target] = 0
+
+    def _advance_next_target(self, player) -> bool:
+        """
+        Setzt `next_target` auf das erste noch offene Ziel (niedrigstes freies Bit).
+        Gibt False zurück, wenn alle Ziele getroffen wurden.
+        """
+        open_bits = ~player.state["hits_mask"] & ATC_ALL_TARGETS_MASK
+        if not open_bits:
+            return False
+        player.next_target = self.targets[(open_bits & -open_bits).bit_length() - 1]
+        return True
+
+    def restore_from_dict(self, data: dict):
+        """Baut die Fortschritts-Bitmasken aus den geladenen Treffern neu auf."""
+        for player in self.game.players:
+            hits = player.state.get("hits", {})
+            player.state["hits_mask"] = sum(
+                bit for target, bit in ATC_TARGET_BITS.items() if hits.get(target, 0)
+            )
 
     def _handle_throw_undo(self, player, ring, segment, players):
         """Macht einen Wurf im ATC-Modus rückgängig."""
         # Da _handle_throw nur gültige Treffer durchlässt, können wir annehmen,
         # dass der rückgängig gemachte Wurf ein gültiger Treffer war.
         target_hit = None
-        if ring in ("Bull", "Bullseye"):
+        if ring in _BULL_RINGS:
             target_hit = "Bull"
-        elif str(segment) in self.targets:
-            target_hit = str(segment)
+        else:
+            # Segment nur einmal umwandeln; die Bit-Tabelle dient als O(1)-Zielmenge.
+            segment_str = str(segment)
+            if segment_str in ATC_TARGET_BITS:
+                target_hit = segment_str
 
         if target_hit:
             # Treffer zurücksetzen
             player.hits[target_hit] = 0
+            player.state["hits_mask"] &= ~ATC_TARGET_BITS[target_hit]
 
-            # Nächstes Ziel neu bestimmen, indem wir das erste unvollständige Ziel suchen
-            for target in self.targets:
-                if player.hits.get(target, 0) == 0:
-                    player.next_target = target
-                    break
+            # Nächstes Ziel neu bestimmen: das erste unvollständige Ziel
+            self._advance_next_target(player)
 
         # Anzeige aktualisieren
         player.sb.update_display(player.hits, player.score)
@@ -102,27 +142,17 @@ class AtC(GameLogicBase):
             str or None: Eine Nachricht über den Spielausgang oder den Wurf, oder None.
         """
         # Determine if the throw is valid for the current target
-        is_valid_hit = False
         current_target_is_bull_type = player.next_target == "Bull"
 
         if current_target_is_bull_type:
-            if ring in ("Bull", "Bullseye"):
-                is_valid_hit = True
-        else:  # Target is a number segment
-            if str(segment) == player.next_target:  # Correct number segment
-                if self.opt_atc == "Single":  # Any hit on the correct number is valid
-                    is_valid_hit = True
-                elif self.opt_atc == "Double" and ring == "Double":
-                    is_valid_hit = True
-                elif self.opt_atc == "Triple" and ring == "Triple":
-                    is_valid_hit = True
+            is_valid_hit = ring in _BULL_RINGS
+        else:  # Target is a number segment: correct number and an accepted ring
+            is_valid_hit = str(segment) == player.next_target and ring in self._valid_rings
 
         if not is_valid_hit:
             player.sb.update_score(player.score)  # Update display for throw history
 
-            opt_atc_display = ""
-            if not current_target_is_bull_type and self.opt_atc != "Single":
-                opt_atc_display = self.opt_atc + " "
+            opt_atc_display = "" if current_target_is_bull_type else self._opt_atc_prefix
 
             base_msg = f"{player.name} muss {opt_atc_display}{player.next_target} treffen!"
 
@@ -140,15 +170,10 @@ class AtC(GameLogicBase):
 
         # --- Treffer auf AtC-Ziel verarbeiten ---
         player.hits[player.next_target] = 1
+        player.state["hits_mask"] |= ATC_TARGET_BITS[player.next_target]
 
         # Nächstes Ziel bestimmen oder Gewinnbedingung prüfen
-        all_targets_closed = True
-        for target in self.targets:
-            hit = player.hits.get(target, 0)
-            if hit == 0:
-                all_targets_closed = False
-                player.next_target = target
-                break
+        all_targets_closed = not self._advance_next_target(player)
 
         player.sb.update_display(player.hits, player.score)  # Update display after successful hit
 
@@ -161,8 +186,5 @@ class AtC(GameLogicBase):
             return ("win", msg)
 
         # --- Weiter / Nächster Spieler ---
-        if len(player.throws) == 3:
-            # Turn ends
-            return ("ok", None)
-
-        return ("ok", None)  # Throw processed, turn continues
+        # Ob die Aufnahme nach dem 3. Dart endet, entscheidet der GameController.
+        return ("ok", None)
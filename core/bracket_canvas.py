@@ -134,13 +134,16 @@ class BracketCanvas(tk.Canvas):
                 match_positions[(next_round_idx, next_match_idx)] = y_center
 
         # --- Phase 2: Alles zeichnen ---
+        # Linke X-Kante der Match-Boxen jeder Runde, einmal für alle Zeichenschritte berechnet.
+        column_x = self._get_column_x(len(rounds_data))
+
         # Zuerst die Runden-Titel
-        for round_idx, _ in enumerate(rounds_data):
-            x_pos = self.PADDING + (round_idx * self.ROUND_WIDTH) + (self.BOX_WIDTH / 2)
-            y_pos = self.HEADER_HEIGHT / 2
+        title_y = self.HEADER_HEIGHT / 2
+        for round_idx, x_box in enumerate(column_x):
+            x_pos = x_box + (self.BOX_WIDTH / 2)
             self.create_text(
                 x_pos,
-                y_pos,
+                title_y,
                 text=f"Runde {round_idx + 1}",
                 font=self.LOSER_FONT,
                 fill=self.LOSER_COLOR,
@@ -148,11 +151,11 @@ class BracketCanvas(tk.Canvas):
             )
 
         # Zuerst die Verbindungslinien
-        self._draw_connecting_lines(rounds_data, match_positions, bracket_type)
+        self._draw_connecting_lines(rounds_data, match_positions, bracket_type, column_x)
 
         # Dann die Match-Boxen
         for (round_idx, match_idx), y_center in match_positions.items():
-            x_pos = self.PADDING + (round_idx * self.ROUND_WIDTH)
+            x_pos = column_x[round_idx]
             y_pos = y_center - (self.BOX_HEIGHT / 2)
             match = rounds_data[round_idx][match_idx]
             is_next = match == next_match
@@ -161,7 +164,7 @@ class BracketCanvas(tk.Canvas):
         # --- Phase 3: Den Bracket-Sieger zeichnen ---
         if bracket_winner:
             last_round_idx = len(rounds_data) - 1
-            final_match_x = self.PADDING + (last_round_idx * self.ROUND_WIDTH)
+            final_match_x = column_x[last_round_idx]
             final_match_y_center = match_positions.get((last_round_idx, 0))
 
             if final_match_y_center:
@@ -188,11 +191,19 @@ class BracketCanvas(tk.Canvas):
                     fill=self.WINNER_COLOR,
                 )
 
-    def _draw_connecting_lines(self, rounds_data, match_positions, bracket_type="winners"):
+    def _get_column_x(self, num_rounds):
+        """Gibt die linke X-Koordinate der Match-Boxen für jede Runde zurück."""
+        return [self.PADDING + (round_idx * self.ROUND_WIDTH) for round_idx in range(num_rounds)]
+
+    def _draw_connecting_lines(
+        self, rounds_data, match_positions, bracket_type="winners", column_x=None
+    ):
         """Zeichnet die Verbindungslinien zwischen den Matches."""
+        if column_x is None:
+            column_x = self._get_column_x(len(rounds_data))
         for round_idx in range(len(rounds_data) - 1):
-            x_start = self.PADDING + (round_idx * self.ROUND_WIDTH) + self.BOX_WIDTH
-            x_end = self.PADDING + ((round_idx + 1) * self.ROUND_WIDTH)
+            x_start = column_x[round_idx] + self.BOX_WIDTH
+            x_end = column_x[round_idx + 1]
             x_mid = (x_start + x_end) / 2
 
             next_round_idx = round_idx + 1
@@ -219,32 +230,34 @@ class BracketCanvas(tk.Canvas):
                     # Standard-Zeichenlogik für normale Runden
                     parent1_y = match_positions.get((round_idx, next_match_idx * 2))
                     parent2_y = match_positions.get((round_idx, next_match_idx * 2 + 1))
-                    if parent1_y:
-                        self.create_line(
-                            x_start,
-                            parent1_y,
-                            x_mid,
-                            parent1_y,
-                            fill=self.LINE_COLOR,
-                        )
-                    if parent2_y:
-                        self.create_line(
-                            x_start,
-                            parent2_y,
-                            x_mid,
-                            parent2_y,
-                            fill=self.LINE_COLOR,
-                        )
                     if parent1_y and parent2_y:
+                        # Ein einziger Linienzug statt vier Einzellinien: Eltern 1 -> Mitte ->
+                        # Kind -> zurück zur Mitte -> Eltern 2. Das Kind liegt auf der
+                        # senkrechten Verbindung, der Rückweg überdeckt nur bereits Gezeichnetes.
                         self.create_line(
-                            x_mid,
-                            parent1_y,
-                            x_mid,
-                            parent2_y,
+                            x_start, parent1_y,
+                            x_mid, parent1_y,
+                            x_mid, child_y,
+                            x_end, child_y,
+                            x_mid, child_y,
+                            x_mid, parent2_y,
+                            x_start, parent2_y,
                             fill=self.LINE_COLOR,
                         )
-                    if parent1_y or parent2_y:
-                        self.create_line(x_mid, child_y, x_end, child_y, fill=self.LINE_COLOR)
+                    elif parent1_y or parent2_y:
+                        parent_y = parent1_y or parent2_y
+                        if parent_y == child_y:
+                            # Freilos: Eltern und Kind liegen auf einer Höhe.
+                            self.create_line(
+                                x_start, parent_y, x_end, child_y, fill=self.LINE_COLOR
+                            )
+                        else:
+                            self.create_line(
+                                x_start, parent_y, x_mid, parent_y, fill=self.LINE_COLOR
+                            )
+                            self.create_line(
+                                x_mid, child_y, x_end, child_y, fill=self.LINE_COLOR
+                            )
 
     def _draw_match_box(self, x, y, match, is_next_match):
         """Zeichnet eine einzelne Spielpaarung mit verbessertem Stil."""
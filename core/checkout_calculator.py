@@ -17,6 +17,7 @@
 """
 Dieses Modul enthält die Logik zur Berechnung von Finish-Wegen für x01-Spiele.
 """
+import functools
 import logging
 import pathlib
 from .json_io_handler import JsonIOHandler
@@ -52,6 +53,10 @@ logger = logging.getLogger(__name__)
 # Die Checkout-Pfade werden nur einmal beim Import des Moduls geladen.
 CHECKOUT_PATHS = _load_checkout_paths()
 
+# Bogey-Nummern: Scores bis 170, die nicht mit 3 Darts gefinished werden können.
+# Einmalig beim Import als frozenset angelegt, da sie bei jedem Vorschlag geprüft werden.
+BOGEY_NUMBERS = frozenset({169, 168, 166, 165, 163, 162, 159})
+
 # Eine vorberechnete Map der bestmöglichen Single-Dart-Finishes.
 # Die Reihenfolge der Erstellung ist wichtig, da sie die Priorität bestimmt
 # (z.B. T20 für 60). Höhere Priorität überschreibt niedrigere.
@@ -90,6 +95,17 @@ _ORDERED_THROWS = (
     + [(f"{i}", i) for i in range(20, 0, -1)]
 )
 
+# Alle Wurf-Token, die in Finish-Wegen vorkommen, mit ihrem (Ring, Segment)-Tupel.
+# "25" ist das Single-Bull, "BE" das Bullseye; reine Zahlen sind Single-Felder.
+_THROW_TOKENS = {
+    f"{char}{i}": (ring, i)
+    for char, ring in (("T", "Triple"), ("D", "Double"), ("S", "Single"))
+    for i in range(1, 21)
+}
+_THROW_TOKENS.update({str(i): ("Single", i) for i in range(1, 21)})
+_THROW_TOKENS["25"] = ("Bull", 25)
+_THROW_TOKENS["BE"] = ("Bullseye", 50)
+
 
 def _get_single_dart_throw(score: int) -> str | None:
     """
@@ -223,7 +239,7 @@ class CheckoutCalculator:
             return "-"
 
         # Bogey-Nummern (nicht finishbar mit 3 Darts)
-        if darts_left == 3 and score in (169, 168, 166, 165, 163, 162, 159):
+        if darts_left == 3 and score in BOGEY_NUMBERS:
             return "-"
 
         # Maximale Finish-Scores pro Dart-Anzahl
@@ -298,3 +314,48 @@ class CheckoutCalculator:
                     return path.replace(" ", ", ")
 
         return "-"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def build_reachability_table(
+        opt_out="Double", darts_left=3, preferred_double: int | None = None
+    ) -> tuple[bool, ...]:
+        """
+        Gibt für jeden Punktestand von 0 bis 170 an, ob er mit `darts_left` Darts
+        ausgecheckt werden kann (Index = Punktestand).
+
+        Die Tabelle wird pro (opt_out, darts_left, preferred_double) nur einmal berechnet,
+        sodass wiederholte Finish-Prüfungen zu einem Tupel-Zugriff werden.
+        """
+        suggest = CheckoutCalculator.get_checkout_suggestion
+        return tuple(
+            suggest(score, opt_out, darts_left, preferred_double) != "-" for score in range(171)
+        )
+
+    @staticmethod
+    def get_checkout_targets(
+        score,
+        opt_out="Double",
+        darts_left=3,
+        preferred_double: int | None = None,
+    ) -> list[tuple[str, int]] | None:
+        """
+        Gibt den Finish-Vorschlag als Liste von (Ring, Segment)-Tupeln zurück.
+
+        Liefert denselben Weg wie `get_checkout_suggestion`, aber bereits strukturiert,
+        sodass Aufrufer wie die KI den String nicht selbst zerlegen müssen.
+
+        Returns:
+            list[tuple[str, int]] | None: Die Würfe des Weges oder None, wenn kein
+                Finish möglich ist.
+        """
+        path_str = CheckoutCalculator.get_checkout_suggestion(
+            score, opt_out, darts_left, preferred_double=preferred_double
+        )
+        if not path_str or path_str == "-":
+            return None
+        try:
+            return [_THROW_TOKENS[token] for token in path_str.split(", ")]
+        except KeyError:
+            logger.warning("Unbekannter Wurf im Finish-Weg '%s'.", path_str)
+            return None
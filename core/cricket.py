@@ -80,16 +80,40 @@ class Cricket(GameLogicBase):
             self.CRICKET_TARGET_VALUES = TACTICS_TARGET_VALUES
             self.CRICKET_SEGMENTS_AS_STR = TACTICS_SEGMENTS_AS_STR
         self.targets = [k for k in self.CRICKET_TARGET_VALUES.keys()]
+        # Ein Bit pro Ziel (in Spielreihenfolge) für die Bitmaske der geschlossenen Ziele.
+        self.target_bits = {target: 1 << i for i, target in enumerate(self.targets)}
 
     def initialize_player_state(self, player):
         """
         Setzt den Anfangs-Score auf 0 und initialisiert die Treffer-Map für Cricket.
         """
         player.state["hits"] = {}
+        player.state["closed_mask"] = 0
         player.score = 0
         for target in self.get_targets():
             player.state["hits"][target] = 0
 
+    def _update_closed_mask(self, player, target):
+        """
+        Hält die Bitmaske der geschlossenen Ziele (`state["closed_mask"]`) nach einer
+        Änderung der Treffer auf `target` aktuell. Die Treffer-Map bleibt die Quelle
+        der Wahrheit; die Maske erspart der KI das Auswerten aller Treffer.
+        """
+        bit = self.target_bits[target]
+        mask = player.state.get("closed_mask", 0)
+        if player.state["hits"].get(target, 0) >= 3:
+            player.state["closed_mask"] = mask | bit
+        else:
+            player.state["closed_mask"] = mask & ~bit
+
+    def restore_from_dict(self, data: dict):
+        """Baut die Bitmasken der geschlossenen Ziele aus den geladenen Treffern neu auf."""
+        for player in self.game.players:
+            hits = player.state.get("hits", {})
+            player.state["closed_mask"] = sum(
+                bit for target, bit in self.target_bits.items() if hits.get(target, 0) >= 3
+            )
+
     def get_targets(self):
         """Gibt die Liste der Ziele für den aktuellen Spielmodus zurück."""
         return self.targets
@@ -125,6 +149,7 @@ class Cricket(GameLogicBase):
         # 3. Treffer rückgängig machen
         player.state["hits"][target_hit] = max(0, marks_before_throw - marks_scored)
         marks_after_undo = player.state["hits"][target_hit]
+        self._update_closed_mask(player, target_hit)
 
         # 4. Punkte rückgängig machen, falls welche erzielt wurden
         # Punkte wurden nur erzielt, wenn das Ziel schon vorher geschlossen war (>=3 Treffer)
@@ -223,6 +248,7 @@ class Cricket(GameLogicBase):
             # --- Treffer auf Cricket-Ziel verarbeiten (optimierte Logik) ---
             marks_before_throw = player.state["hits"].get(target_hit, 0)
             player.state["hits"][target_hit] += marks_scored
+            self._update_closed_mask(player, target_hit)
 
             # Berechne, wie viele der geworfenen Marks punktend waren
             # (d.h. auf ein bereits vom Spieler geschlossenes Ziel fielen)
@@ -83,6 +83,9 @@ class DartBoard:
         self.center_x = None
         self.center_y = None
         self.canvas = None  # Wird in _create_board gesetzt
+        # Gepufferte Zielkoordinaten je (Ring, Segment) für die KI. Wird bei jeder
+        # Größenänderung des Canvas verworfen (siehe _on_canvas_configure).
+        self._target_coords_cache = {}
         self.throw_delay = self.game_view_manager.settings_manager.get("ai_throw_delay", 1000) # Für KI-Würfe
         self.root = tk.Toplevel(parent_root)
         if len(self.game_view_manager.game_options.name) == 3:  # = x01-Spiele
@@ -181,8 +184,24 @@ class DartBoard:
             self.dart_image_ids_on_canvas.append(dart_id)
 
     def get_coords_for_target(self, ring: str, segment: int) -> tuple[int, int] | None:
-        """Ermittelt die idealen (x, y)-Koordinaten für ein bestimmtes Ziel auf dem Board."""
-        return DartboardGeometry.get_target_coords_scaled(ring, segment, self.canvas, self.skaliert)
+        """
+        Ermittelt die idealen (x, y)-Koordinaten für ein bestimmtes Ziel auf dem Board.
+        Das Ergebnis wird je (Ring, Segment) gepuffert, da die Berechnung die Canvas-Größe
+        über Tk abfragt und sich bei unverändertem Canvas nicht ändert.
+        """
+        key = (ring, segment)
+        coords = self._target_coords_cache.get(key)
+        if coords is None:
+            coords = DartboardGeometry.get_target_coords_scaled(
+                ring, segment, self.canvas, self.skaliert
+            )
+            if coords is not None:
+                self._target_coords_cache[key] = coords
+        return coords
+
+    def _on_canvas_configure(self, event=None):
+        """Verwirft die gepufferten Zielkoordinaten, sobald sich die Canvas-Geometrie ändert."""
+        self._target_coords_cache.clear()
 
     def polar_angle(self, x, y):
         """
@@ -319,6 +338,7 @@ class DartBoard:
         self.canvas.create_image(0, 0, image=photo, anchor=tk.NW)
         self.canvas.image = photo
         self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
 
         # Buttons erstellen
         btn_frame = ttk.Frame(self.root)
@@ -86,6 +86,18 @@ class DartboardGeometry:
         """
         target_name = target_name.upper().strip()
 
+        # Schneller Pfad: Alle gültigen Standard-Namen sind beim Import vorberechnet.
+        coords = _TARGET_COORDS.get(target_name)
+        if coords is not None:
+            return coords
+        return DartboardGeometry._compute_target_coords(target_name)
+
+    @staticmethod
+    def _compute_target_coords(target_name: str) -> tuple[int, int] | None:
+        """
+        Berechnet die Mittelpunkt-Koordinaten für einen bereits normalisierten Zielnamen.
+        Wird für die Vorberechnung und für nicht-kanonische Schreibweisen (z.B. "T05") genutzt.
+        """
         # For both Bull and Bullseye, the geometric aiming point is the center of the board.
         if target_name in ("BE", "B"):
             return (DartboardGeometry.CENTER, DartboardGeometry.CENTER)
@@ -185,3 +197,11 @@ class DartboardGeometry:
         x = int(center_x + radius * math.cos(angle_rad))
         y = int(center_y - radius * math.sin(angle_rad))
         return x, y
+
+
+# Vorberechnete Koordinaten aller 62 Standard-Ziele (S/D/T 1-20, BE, B).
+# Das Board ist fix, daher genügt eine einmalige Berechnung beim Import.
+_TARGET_COORDS = {
+    name: DartboardGeometry._compute_target_coords(name)
+    for name in [f"{ring}{segment}" for ring in "SDT" for segment in range(1, 21)] + ["BE", "B"]
+}
@@ -210,7 +210,11 @@ class DatabaseManager:
             alembic_cfg.set_main_option("sqlalchemy.url", self.engine.url.render_as_string(hide_password=False))
 
             try:
-                command.upgrade(alembic_cfg, "head")
+                # Die Verbindung der bestehenden Engine an env.py durchreichen, damit
+                # Alembic keine zweite Engine samt Verbindungsaufbau erzeugen muss.
+                with self.engine.begin() as connection:
+                    alembic_cfg.attributes["connection"] = connection
+                    command.upgrade(alembic_cfg, "head")
                 logger.info("Datenbank-Migrationen erfolgreich abgeschlossen.")
             except Exception as e:
                 logger.error(f"Datenbank-Migration fehlgeschlagen: {e}", exc_info=True)
@@ -281,7 +281,18 @@ class GameViewManager:
                     if effects_enabled and 1 <= total_round_score <= 7 and self.dartboard:
                         self.dartboard.show_low_score_effect()
 
-        if result.message and self.dartboard:
+        if (
+            result.message
+            and result.status == "invalid_target"
+            and self.game_options.name == "Around the Clock"
+            and getattr(player, "sb", None)
+        ):
+            # Bei Around the Clock kommt dieser Hinweis bei jedem Fehlwurf und wird daher
+            # nicht-modal im Scoreboard angezeigt, statt den Spielablauf zu blockieren.
+            # Der Hinweis zum letzten Dart bleibt stehen, bis der Spieler 'Weiter' klickt.
+            duration_ms = None if len(player.throws) >= 3 else 2500
+            player.sb.show_transient_message(result.message, duration_ms=duration_ms)
+        elif result.message and self.dartboard:
             ui_utils.show_message_for_throw_result(result, self.dartboard.root, auto_close_for_ai_after_ms=auto_close_ms)
 
     def update_button_states(self, player: "Player", game_ended: bool):
@@ -63,6 +63,12 @@ class BaseScoreBoard:
         main_frame = ttk.Frame(self.score_window, padding=(10, 5))
         main_frame.pack(expand=True, fill="both")
 
+        # Statuszeile für nicht-modale Hinweise; wird nur von Unterklassen angelegt,
+        # die sie benötigen (siehe _create_status_line).
+        self.status_var = None
+        self._status_after_id = None
+        self._width = width
+
         # --- Widgets im Haupt-Frame erstellen ---
         self._create_header(main_frame)
         self._create_extra_widgets(main_frame)  # Hook für Unterklassen
@@ -128,10 +134,55 @@ class BaseScoreBoard:
             self.indicator_label.config(background=self.score_window.cget("bg"))
             self.score_window.title(self.original_title)
 
+    def _create_status_line(self, parent):
+        """Legt die nicht-modale Statuszeile für kurze Hinweise (z.B. "muss X treffen") an."""
+        self.status_var = tk.StringVar()
+        ttk.Label(
+            parent,
+            textvariable=self.status_var,
+            foreground="red",
+            wraplength=self._width - 30,
+            justify="center",
+        ).pack(fill="x", pady=(5, 0))
+
+    def show_transient_message(self, message: str, duration_ms: int | None = 2500):
+        """
+        Zeigt einen Hinweis in der Statuszeile an. Blockiert im Gegensatz zu
+        einer MessageBox nicht den Spielablauf.
+
+        Args:
+            message (str): Der anzuzeigende Hinweis.
+            duration_ms (int | None): Zeit, nach der sich der Hinweis selbst
+                ausblendet. Bei None bleibt er bis zur nächsten Aktualisierung
+                des Scoreboards stehen.
+        """
+        if self.status_var is None or not self.score_window.winfo_exists():
+            return
+        self._cancel_status_timer()
+        self.status_var.set(message)
+        if duration_ms is not None:
+            self._status_after_id = self.score_window.after(
+                duration_ms, self._clear_transient_message
+            )
+
+    def _cancel_status_timer(self):
+        if self._status_after_id:
+            self.score_window.after_cancel(self._status_after_id)
+            self._status_after_id = None
+
+    def _clear_transient_message(self):
+        self._status_after_id = None
+        if self.status_var is not None:
+            self.status_var.set("")
+
     def set_score_value(self, score):
         self.score_var.set(str(score))
 
     def update_score(self, score):
+        if self.status_var is not None:
+            # Jede neue Aktion (Wurf, Undo, Spielerwechsel) löst einen stehenden Hinweis ab.
+            self._cancel_status_timer()
+            self._clear_transient_message()
         self.set_score_value(score)
         self.throws_list.delete(0, tk.END)
         for (
@@ -277,6 +328,9 @@ class TargetBasedScoreBoard(BaseScoreBoard):
                 chk.pack(side="left")
                 self.hit_check_vars[target] = [var]
 
+        if self.game.options.name == "Around the Clock":
+            self._create_status_line(main_frame)
+
     def update_display(self, hits, score):
         super().update_score(score)
         for target, vars_list in self.hit_check_vars.items():
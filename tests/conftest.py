@@ -140,6 +140,18 @@ def mock_pygame_mixer(request):
         mock_sound.return_value.get_busy.return_value = False
         yield
 
+
+@pytest.fixture(autouse=True)
+def clear_ai_checkout_cache():
+    """Leert den Checkout-Cache der KI, damit gepatchte Calculator-Ergebnisse nicht in andere Tests durchsickern."""
+    from core.ai_strategy import _cached_checkout_target
+    from core.checkout_calculator import CheckoutCalculator
+
+    _cached_checkout_target.cache_clear()
+    CheckoutCalculator.build_reachability_table.cache_clear()
+    yield
+
+
 @pytest.fixture
 def mock_profile_manager():
     """
@@ -332,6 +332,21 @@ def test_apply_strategic_offset(ai_player_with_mocks):
     assert no_offset_coords == center_coords_t20
 
 
+def test_strategic_offset_distances_follow_scale_and_difficulty(ai_player_with_mocks):
+    """Testet, ob die gepufferten Offset-Distanzen bei neuer Skalierung oder Schwierigkeit neu berechnet werden."""
+    ai_player, _ = ai_player_with_mocks
+    skaliert = {"triple_outer": 520, "triple_inner": 470, "double_outer": 835, "double_inner": 785}
+
+    ai_player.difficulty = "Champion"
+    assert ai_player._get_strategic_offset_distances(skaliert)["Triple"] == pytest.approx(50 * 0.35)
+
+    ai_player.difficulty = "Anfänger"
+    assert ai_player._get_strategic_offset_distances(skaliert)["Triple"] == pytest.approx(50 * 0.1)
+
+    rescaled = {"triple_outer": 260, "triple_inner": 235, "double_outer": 417, "double_inner": 392}
+    assert ai_player._get_strategic_offset_distances(rescaled)["Double"] == pytest.approx(25 * 0.1)
+
+
 def test_get_strategic_target_for_cricket_opening(cricket_ai_player):
     """Testet die Zielauswahl für Cricket, wenn noch Ziele offen sind."""
     ai_player, _ = cricket_ai_player
@@ -493,6 +508,30 @@ def test_get_strategic_target_for_cricket_leading_logic(cricket_ai_player):
     assert target == ("Triple", 19), "KI sollte 19 schließen, da sie bereits in Führung liegt."
 
 
+def test_cricket_opponent_state_is_reevaluated_on_every_dart(cricket_ai_player):
+    """
+    Verifiziert: Ändern sich die Gegner-Treffer während der Aufnahme der KI
+    (z.B. durch Undo oder ein geladenes Spiel), zielt die KI sofort auf den neuen Stand.
+    """
+    ai_player, mock_game = cricket_ai_player
+    ai_player.difficulty = "Profi"
+    ai_player.state["hits"] = {}
+    ai_player.score = 0
+
+    mock_opponent = MagicMock(spec=Player)
+    mock_opponent.score = 0
+    mock_opponent.hits = {"20": 3}
+    mock_game.players = [ai_player, mock_opponent]
+
+    # Erster Dart: Gegner hat die 20 zu, die KI muss verteidigen.
+    assert ai_player.strategy.get_target(throw_number=1) == ("Triple", 20)
+
+    # Zweiter Dart derselben Aufnahme: Der Gegner hat nun die 19 statt der 20 zu.
+    ai_player.throws = [("Single", 1, None)]
+    mock_opponent.hits = {"19": 3}
+    assert ai_player.strategy.get_target(throw_number=2) == ("Triple", 19)
+
+
 def test_get_strategic_target_fallback(ai_player_with_mocks):
     """Testet die Fallback-Zielauswahl."""
     ai_player, mock_game = ai_player_with_mocks
@@ -840,20 +879,6 @@ def test_adaptive_ai_execution_lookup_key_format(ai_player_with_mocks):
         # Der Key für die adaptive Berechnung muss 'T20' sein
         assert mock_adaptive.call_args[0][1] == "T20"
 
-def test_parse_target_string(ai_player_with_mocks):
-    """Testet die Hilfsmethode zum Parsen von Ziel-Strings."""
-    strategy_instance = ai_player_with_mocks[0].strategy
-    assert strategy_instance._parse_target_string("T20") == ("Triple", 20)
-    assert strategy_instance._parse_target_string("D18") == ("Double", 18)
-    assert strategy_instance._parse_target_string("S1") == ("Single", 1)
-    # "BULL" und "BE" sollten beide auf das Bullseye zielen, da dies der höchste Score ist.
-    # Die Unterscheidung zwischen 25 und 50 wird von der `get_ring_segment`-Logik gehandhabt.
-    assert strategy_instance._parse_target_string("BULL") == ("Bullseye", 50)
-    assert strategy_instance._parse_target_string("Bullseye") == ("Bullseye", 50)
-    assert strategy_instance._parse_target_string("BE") == ("Bullseye", 50)
-    assert strategy_instance._parse_target_string("17") == ("Single", 17)
-    assert strategy_instance._parse_target_string("INVALID") == ("Triple", 20)
-
 
 def test_x01_strategic_bust_to_avoid_d1(x01_ai_player):
     """Testet, ob die KI bei 3 oder 2 Rest absichtlich überwirft."""
@@ -888,7 +913,9 @@ def test_execute_throw_simulates_click(
     ai_player.strategy.get_target.return_value = ("Triple", 20)
 
     # Konfiguriert die Mocks für vorhersagbare "Zufälligkeit"
-    mock_uniform.side_effect = [1.570796, 10]  # Winkel = pi/2, Distanz = 10px
+    # Distanz = Radius * sqrt(u): mit Radius 10 und u = 1 ergibt sich genau 10px.
+    ai_player.throw_radius = 10
+    mock_uniform.side_effect = [1.570796, 1.0]  # Winkel = pi/2, Flächenanteil = 1
     mock_cos.return_value = 0  # cos(pi/2) ≈ 0
     mock_sin.return_value = 1  # sin(pi/2) = 1
 
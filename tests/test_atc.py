@@ -110,3 +110,31 @@ def test_undo_restores_target(atc_logic, player):
 
     assert player.state["next_target"] == "1"
     assert player.state["hits"]["1"] == 0
+
+
+def test_hits_mask_tracks_progress_and_restore(atc_logic, player, mock_game):
+    """Testet, ob die Fortschritts-Bitmaske Treffer, Undo und das Laden abbildet."""
+    atc_logic._handle_throw(player, "Single", 1, [])
+    atc_logic._handle_throw(player, "Single", 2, [])
+    assert player.state["hits_mask"] == 0b11
+
+    atc_logic._handle_throw_undo(player, "Single", 2, [])
+    assert player.state["hits_mask"] == 0b1
+    assert player.state["next_target"] == "2"
+
+    player.state.pop("hits_mask")
+    mock_game.players = [player]
+    atc_logic.restore_from_dict({})
+    assert player.state["hits_mask"] == 0b1
+
+
+def test_players_do_not_share_hits(mock_game, atc_logic, player):
+    """Jeder Spieler muss eine eigene Treffer-Map erhalten."""
+    other = Player(name="Other", game=mock_game)
+    atc_logic.initialize_player_state(other)
+    other.sb = MagicMock()
+
+    atc_logic._handle_throw(player, "Single", 1, [])
+
+    assert other.state["hits"]["1"] == 0
+    assert other.state["next_target"] == "1"
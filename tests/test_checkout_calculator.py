@@ -108,6 +108,33 @@ class TestCheckoutCalculator(unittest.TestCase):
             "T20, D16",
         )
 
+    def test_reachability_table_matches_suggestions(self):
+        """Die Finish-Tabelle muss mit den einzelnen Vorschlägen übereinstimmen."""
+        for darts_left in (1, 2, 3):
+            table = CheckoutCalculator.build_reachability_table("Double", darts_left)
+            self.assertEqual(len(table), 171)
+            for score in range(171):
+                with self.subTest(score=score, darts_left=darts_left):
+                    self.assertEqual(
+                        table[score],
+                        CheckoutCalculator.get_checkout_suggestion(score, "Double", darts_left) != "-",
+                    )
+        self.assertFalse(CheckoutCalculator.build_reachability_table("Double", 3)[169])
+        self.assertTrue(CheckoutCalculator.build_reachability_table("Double", 3)[170])
+
+    def test_checkout_targets_are_structured(self):
+        """Der strukturierte Finish-Weg entspricht dem String-Vorschlag."""
+        self.assertEqual(
+            CheckoutCalculator.get_checkout_targets(170),
+            [("Triple", 20), ("Triple", 20), ("Bullseye", 50)],
+        )
+        self.assertEqual(
+            CheckoutCalculator.get_checkout_targets(100, darts_left=2),
+            [("Triple", 20), ("Double", 20)],
+        )
+        self.assertEqual(CheckoutCalculator.get_checkout_targets(5, opt_out="Single"), [("Single", 5)])
+        self.assertIsNone(CheckoutCalculator.get_checkout_targets(169))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -190,6 +190,34 @@ def test_undo_scoring_hit_restores_score_and_marks(cricket_logic, players):
     assert player1.state["hits"]["20"] == 3
 
 
+def test_closed_mask_follows_hits_on_throw_and_undo(cricket_logic, players):
+    player1 = players[0]
+    bit_20 = cricket_logic.target_bits["20"]
+    assert player1.state["closed_mask"] == 0
+
+    cricket_logic._handle_throw(player1, "Double", 20, players)
+    assert player1.state["closed_mask"] == 0
+
+    cricket_logic._handle_throw(player1, "Single", 20, players)
+    assert player1.state["closed_mask"] == bit_20
+
+    cricket_logic._handle_throw_undo(player1, "Single", 20, players)
+    assert player1.state["closed_mask"] == 0
+
+
+def test_restore_rebuilds_closed_mask_from_hits(cricket_logic, players, mock_game):
+    player1, player2 = players
+    player1.state["hits"].update({"20": 3, "Bull": 4})
+    player1.state.pop("closed_mask")
+    mock_game.players = players
+
+    cricket_logic.restore_from_dict({})
+
+    bits = cricket_logic.target_bits
+    assert player1.state["closed_mask"] == bits["20"] | bits["Bull"]
+    assert player2.state["closed_mask"] == 0
+
+
 # --- Cut Throat Specific Tests ---
 
 
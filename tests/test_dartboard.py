@@ -174,6 +174,20 @@ class TestDartboardInteractions:
             # Der Klick leitet jetzt an process_player_throw weiter
             mock_controller.process_player_throw.assert_called_once_with(300, 150)
 
+    def test_get_coords_for_target_is_cached_until_configure(self, dartboard_instance):
+        """Testet, ob Zielkoordinaten gepuffert und bei Canvas-Änderungen verworfen werden."""
+        db = dartboard_instance
+        with patch(
+            "core.dartboard.DartboardGeometry.get_target_coords_scaled", return_value=(10, 20)
+        ) as mock_scaled:
+            assert db.get_coords_for_target("Triple", 20) == (10, 20)
+            assert db.get_coords_for_target("Triple", 20) == (10, 20)
+            mock_scaled.assert_called_once()
+
+            db._on_canvas_configure()
+            db.get_coords_for_target("Triple", 20)
+            assert mock_scaled.call_count == 2
+
     def test_quit_game_when_game_is_over(self, dartboard_instance):
         """Testet, ob das Fenster ohne Nachfrage schließt, wenn das Spiel bereits beendet ist."""
         db = dartboard_instance
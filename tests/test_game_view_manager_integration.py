@@ -167,4 +167,50 @@ class TestGameViewManagerIntegration:
         # Madhouse-Flag muss True sein
         gvm.announcer.announce_game_shot.assert_called_once_with(
             "Bob", was_madhouse=True, was_bullseye=False, is_big_fish=False
-        )
\ No newline at end of file
+        )
+
+    def test_invalid_target_feedback_is_shown_non_modal(self, gvm_with_mocks):
+        """Prüft, dass AtC-Hinweise auf ein falsches Ziel im Scoreboard statt per Dialog erscheinen."""
+        gvm = gvm_with_mocks
+        gvm.game_options.name = "Around the Clock"
+        player = MagicMock()
+        player.throws = [("Single", 5, (0, 0))]
+
+        result = ThrowResult(status="invalid_target", message="Bob muss 1 treffen!")
+
+        with patch("core.game_view_manager.ui_utils.show_message_for_throw_result") as mock_show:
+            gvm.display_throw_feedback(result, player, auto_close_ms=1000)
+
+        player.sb.show_transient_message.assert_called_once_with(
+            "Bob muss 1 treffen!", duration_ms=2500
+        )
+        mock_show.assert_not_called()
+
+    def test_invalid_target_hint_on_last_dart_stays_visible(self, gvm_with_mocks):
+        """Prüft, dass der Hinweis zum letzten Dart nicht automatisch ausgeblendet wird."""
+        gvm = gvm_with_mocks
+        gvm.game_options.name = "Around the Clock"
+        player = MagicMock()
+        player.throws = [("Single", 5, (0, 0))] * 3
+
+        result = ThrowResult(status="invalid_target", message="Letzter Dart")
+
+        with patch("core.game_view_manager.ui_utils.show_message_for_throw_result"):
+            gvm.display_throw_feedback(result, player, auto_close_ms=0)
+
+        player.sb.show_transient_message.assert_called_once_with("Letzter Dart", duration_ms=None)
+
+    def test_invalid_target_outside_atc_uses_dialog(self, gvm_with_mocks):
+        """Prüft, dass andere Spiele ihre invalid_target-Meldungen weiterhin per Dialog zeigen."""
+        gvm = gvm_with_mocks
+        gvm.game_options.name = "Micky Mouse"
+        player = MagicMock()
+        player.throws = [("Single", 5, (0, 0))]
+
+        result = ThrowResult(status="invalid_target", message="Bob muss 20 treffen!")
+
+        with patch("core.game_view_manager.ui_utils.show_message_for_throw_result") as mock_show:
+            gvm.display_throw_feedback(result, player, auto_close_ms=0)
+
+        player.sb.show_transient_message.assert_not_called()
+        mock_show.assert_called_once()